@@ -0,0 +1,73 @@
+"""Measure how ``classify_batch`` scales with the number of worker processes.
+
+A synthetic lexicon is built by prefixing every single-word conjugation in
+``cards.db`` (``hablar`` -> ``rehablar``, ``rehablo``, ...), giving tens of
+thousands of verbs.
+
+Example::
+
+    python benchmarks/batch_classification.py --copies 40
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utilities.conjugation_regularity_classifier import (  # noqa: E402
+    ConjugationRegularityClassifier,
+)
+
+PREFIXES = ("", "re", "des", "pre", "con", "sobre", "entre", "contra", "ante", "sub")
+
+
+def load_rows(copies: int) -> list[tuple[str, int, int, str]]:
+    with sqlite3.connect(ROOT / "cards.db") as conn:
+        base = conn.execute(
+            "SELECT verb, form_id, person_id, conjugation FROM cards "
+            "WHERE conjugation NOT LIKE '% %' AND verb NOT LIKE '%se'"
+        ).fetchall()
+    rows = []
+    for n in range(copies):
+        prefix = PREFIXES[n % len(PREFIXES)] + "x" * (n // len(PREFIXES))
+        rows.extend((prefix + v, f, p, prefix + a) for v, f, p, a in base)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=20)
+    args = parser.parse_args()
+
+    classifier = ConjugationRegularityClassifier()
+    rows = load_rows(args.copies)
+    verbs = len({row[0] for row in rows})
+    print(f"{len(rows)} rows, {verbs} verbs")
+
+    baseline = None
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        classes = list(classifier.classify_batch(rows, workers=workers))
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline, expected = seconds, classes
+        elif classes != expected:
+            raise SystemExit(f"{workers} workers changed the results")
+        print(
+            f"{workers:3} workers {seconds * 1000:9.1f} ms  "
+            f"speed-up {baseline / seconds:5.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
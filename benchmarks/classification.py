@@ -0,0 +1,91 @@
+"""Compare the orthographic rule checks with the phonetic-key comparison.
+
+Every ``(hypothetical_regular_conjugation, conjugation)`` pair in ``cards.db``
+is classified by trying each rewrite rule in turn, by the single-pass rule
+engine and by phonetic keys; all three must agree.  The key path is timed
+cold (empty key cache) and warm.
+
+Example::
+
+    python benchmarks/classification.py
+
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utilities.conjugation_regularity_classifier import (  # noqa: E402
+    ACCENT_REVERSE,
+    ORTHOGRAPHIC_RULES,
+    ConjugationRegularityClassifier,
+    phonetic_key,
+)
+
+
+def load_pairs() -> list[tuple[str, str]]:
+    with sqlite3.connect(ROOT / "cards.db") as conn:
+        rows = conn.execute(
+            "SELECT hypothetical_regular_conjugation, conjugation FROM cards"
+        ).fetchall()
+    return [(regular or "", actual or "") for regular, actual in rows]
+
+
+def main() -> None:
+    classifier = ConjugationRegularityClassifier()
+    pairs = load_pairs()
+
+    rewrites = [rule.sub for rule in ORTHOGRAPHIC_RULES]
+
+    def rule_loop(regular: str, actual: str) -> str:
+        if regular == actual:
+            return "regular"
+        if any(rewrite(regular) == actual for rewrite in rewrites) or (
+            regular.translate(ACCENT_REVERSE) == actual.translate(ACCENT_REVERSE)
+        ):
+            return "orthographically_irregular"
+        return "morphologically_irregular"
+
+    def rule_engine(regular: str, actual: str) -> str:
+        if regular == actual:
+            return "regular"
+        if classifier.orthographic_rule(regular, actual):
+            return "orthographically_irregular"
+        return "morphologically_irregular"
+
+    start = time.perf_counter()
+    expected = [rule_loop(r, a) for r, a in pairs]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if [rule_engine(r, a) for r, a in pairs] != expected:
+        raise SystemExit("rule engine disagrees with the rule loop")
+    engine_time = time.perf_counter() - start
+
+    phonetic_key.cache_clear()
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        got = [classifier._classify_cell(r, a) for r, a in pairs]
+        timings.append(time.perf_counter() - start)
+        if got != expected:
+            raise SystemExit("phonetic keys disagree with the rule loop")
+
+    print(f"{len(pairs)} pairs, identical classes")
+    for name, seconds in [
+        ("rule loop", loop_time),
+        ("rule engine", engine_time),
+        ("keys (cold)", timings[0]),
+        ("keys (warm)", timings[1]),
+    ]:
+        print(f"{name:12} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure the import cost of the ``utilities`` modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and
+the cumulative time reported for it is averaged over several runs.
+
+Example::
+
+    python benchmarks/import_time.py --runs 10
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "utilities.phonology",
+    "utilities.regular_form_generator",
+    "utilities.conjugation_regularity_classifier",
+    "utilities.get_conjugation_rae",
+]
+
+
+def import_time_us(module: str) -> int:
+    """Return the cumulative import time of ``module`` in microseconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module")
+    args = parser.parse_args(argv)
+
+    for module in MODULES:
+        samples = [import_time_us(module) for _ in range(args.runs)]
+        print(f"{module:45} {statistics.median(samples) / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Time per-cell ``classify`` calls against one ``classify_paradigm`` per verb.
+
+Both runs start with an empty phonetic-key cache.  The paradigms are rebuilt from the conjugations stored in ``cards.db``, so no
+network access is needed.
+
+Example::
+
+    python benchmarks/paradigm_classification.py
+
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utilities.conjugation_regularity_classifier import (  # noqa: E402
+    ConjugationRegularityClassifier,
+    phonetic_key,
+)
+
+
+def load_paradigms() -> dict[str, dict[str, dict[str, str]]]:
+    with sqlite3.connect(ROOT / "cards.db") as conn:
+        rows = conn.execute("SELECT verb, form, person, conjugation FROM cards")
+        paradigms: dict[str, dict[str, dict[str, str]]] = {}
+        for verb, form, person, conjugation in rows:
+            paradigms.setdefault(verb, {}).setdefault(form, {})[person] = (
+                conjugation or ""
+            )
+    return paradigms
+
+
+def main() -> None:
+    classifier = ConjugationRegularityClassifier()
+    paradigms = load_paradigms()
+    cells = sum(len(p) for forms in paradigms.values() for p in forms.values())
+
+    phonetic_key.cache_clear()
+    start = time.perf_counter()
+    per_cell = {
+        verb: {
+            form: {
+                person: classifier.classify(verb, {form: {person: actual}})
+                for person, actual in persons.items()
+            }
+            for form, persons in forms.items()
+        }
+        for verb, forms in paradigms.items()
+    }
+    per_cell_time = time.perf_counter() - start
+
+    phonetic_key.cache_clear()
+    start = time.perf_counter()
+    whole = {
+        verb: classifier.classify_paradigm(verb, forms)[0]
+        for verb, forms in paradigms.items()
+    }
+    whole_time = time.perf_counter() - start
+
+    if whole != per_cell:
+        raise SystemExit("classify_paradigm disagrees with per-cell classify")
+    print(f"{len(paradigms)} verbs, {cells} cells, identical classes")
+    print(f"per-cell classify   {per_cell_time * 1000:8.1f} ms")
+    print(f"classify_paradigm   {whole_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
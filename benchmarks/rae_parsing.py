@@ -0,0 +1,88 @@
+"""Compare full-page and section-only parsing of stored RAE pages.
+
+The sample pages in ``tests/rae_pages`` (gzipped HTML), plus every page in
+the RAE HTML cache when ``--cache-dir`` is given, are parsed twice: by
+building a tree of the whole page, as the fetcher used to, and by parsing
+only the conjugation section.  Both must give identical tables.  Time and
+peak memory per page are reported.
+
+Example::
+
+    python benchmarks/rae_parsing.py
+    python benchmarks/rae_parsing.py --cache-dir build/rae_cache
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utilities.get_conjugation_rae import RAEConjugationFetcher  # noqa: E402
+
+SAMPLE_PAGES = ROOT / "tests" / "rae_pages"
+
+
+def load_pages(cache_dir: Path | None) -> list[tuple[str, str]]:
+    pages = []
+    for path in sorted(SAMPLE_PAGES.glob("*.html.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            pages.append((path.name.split(".")[0], f.read()))
+    for path in sorted(cache_dir.glob("*.json.gz") if cache_dir else []):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            record = json.load(f)
+        pages.append((record["verb"], record["html"]))
+    return pages
+
+
+def measure(parse, pages) -> tuple[list, list[float], list[int]]:
+    results, seconds, peaks = [], [], []
+    for _, html in pages:
+        tracemalloc.start()
+        start = time.perf_counter()
+        results.append(parse(html))
+        seconds.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return results, seconds, peaks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache-dir", type=Path, help="RAE HTML cache directory")
+    args = parser.parse_args()
+
+    pages = load_pages(args.cache_dir)
+    fetcher = RAEConjugationFetcher(cache=False, offline=True)
+    fetcher._parse_conjugation("<html></html>", full_page=True)  # import bs4
+    full, full_s, full_mem = measure(
+        lambda html: fetcher._parse_conjugation(html, full_page=True), pages
+    )
+    section, section_s, section_mem = measure(fetcher._parse_conjugation, pages)
+    for (verb, _), old, new in zip(pages, full, section):
+        if old != new:
+            raise SystemExit(f"section parsing differs for {verb}")
+
+    print(f"{len(pages)} pages, identical tables")
+    print(f"{'':14} {'ms/page':>9} {'peak KiB/page':>14}")
+    for name, seconds, peaks in [
+        ("full page", full_s, full_mem),
+        ("section only", section_s, section_mem),
+    ]:
+        print(
+            f"{name:14} {statistics.mean(seconds) * 1000:9.2f} "
+            f"{statistics.mean(peaks) / 1024:14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare the syllabification backends over every word in ``cards.db``.
+
+Caches are bypassed so each backend does the full work for every word; the
+``pyphen`` backend is timed both cold (fresh dictionary) and warm (its own
+internal memo populated).
+
+Example::
+
+    python benchmarks/syllabification.py
+
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utilities import phonology  # noqa: E402
+from utilities.syllabifier import syllabify  # noqa: E402
+
+
+def load_words() -> list[str]:
+    with sqlite3.connect(ROOT / "cards.db") as conn:
+        rows = conn.execute(
+            "SELECT conjugation, hypothetical_regular_conjugation FROM cards"
+        ).fetchall()
+    return sorted({w for row in rows for text in row for w in (text or "").split()})
+
+
+def timed(func, words: list[str]) -> float:
+    start = time.perf_counter()
+    for word in words:
+        func(word)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    words = load_words()
+    pyphen_cold = timed(phonology.pyphen_syllables, words)
+    pyphen_warm = timed(phonology.pyphen_syllables, words)
+    native = timed(syllabify, words)
+    print(f"{len(words)} distinct words")
+    for name, seconds in [
+        ("pyphen (cold)", pyphen_cold),
+        ("pyphen (warm)", pyphen_warm),
+        ("native", native),
+    ]:
+        per_word = seconds / len(words) * 1e6
+        print(f"{name:15} {seconds * 1000:8.1f} ms  {per_word:6.2f} us/word")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ import os
 import time
 from datetime import datetime
 
+from utilities.compound_tenses import CompoundTenseDeriver
+
 # Add logging functionality
 def log(message, level="INFO"):
     """Simple logging function with timestamps"""
@@ -113,7 +115,15 @@ def main():
         'subjuntivo_imperfecto': '↫↫↫',
         'subjuntivo_futuro': '↬↬↬',
         'imperativo_afirmativo': '!!!',
-        'imperativo_negativo': '!!!'
+        'imperativo_negativo': '!!!',
+        'indicativo_perfecto': '✓⊙✓',
+        'indicativo_pluscuamperfecto': '✓⇠✓',
+        'indicativo_futuro_perfecto': '✓→✓',
+        'condicional_perfecto': '✓◇✓',
+        'subjuntivo_perfecto': '✓∿✓',
+        'subjuntivo_pluscuamperfecto': '✓↫✓',
+        'indicativo_presente_progresivo': '⋯⊙⋯',
+        'indicativo_imperfecto_progresivo': '⋯⇠⋯'
     }
     
     form_display_map = {
@@ -129,9 +139,49 @@ def main():
         'subjuntivo_imperfecto': '↫↫↫ subjuntivo imperfecto ↫↫↫',
         'subjuntivo_futuro': '↬↬↬ subjuntivo futuro ↬↬↬',
         'imperativo_afirmativo': '!!! imperativo afirmativo !!!',
-        'imperativo_negativo': '!!! imperativo negativo !!!'
+        'imperativo_negativo': '!!! imperativo negativo !!!',
+        'indicativo_perfecto': '✓⊙✓ indicativo pretérito perfecto ✓⊙✓',
+        'indicativo_pluscuamperfecto': '✓⇠✓ indicativo pluscuamperfecto ✓⇠✓',
+        'indicativo_futuro_perfecto': '✓→✓ indicativo futuro perfecto ✓→✓',
+        'condicional_perfecto': '✓◇✓ condicional perfecto ✓◇✓',
+        'subjuntivo_perfecto': '✓∿✓ subjuntivo pretérito perfecto ✓∿✓',
+        'subjuntivo_pluscuamperfecto': '✓↫✓ subjuntivo pluscuamperfecto ✓↫✓',
+        'indicativo_presente_progresivo': '⋯⊙⋯ presente progresivo ⋯⊙⋯',
+        'indicativo_imperfecto_progresivo': '⋯⇠⋯ imperfecto progresivo ⋯⇠⋯'
     }
     
+    def make_hint(verb, form, person):
+        person_text = person_map.get(person, '')
+        form_symbol = form_symbol_map.get(form, '')
+        
+        if person_text and form_symbol:
+            return f"{form_symbol}...{person_text}...{verb}...{person_text}...{form_symbol}"
+        elif person_text:
+            return f"{person_text}...{verb}...{person_text}"
+        elif form_symbol:
+            return f"{form_symbol}...{verb}...{form_symbol}"
+        else:
+            return f"{verb}"
+    
+    def make_extra_field(hypothetical_regular_conjugation, regularity_class, details):
+        extra_parts = ['<div class="extra-info">']
+        
+        if regularity_class == 'regular':
+            regularity_html = '<span class="regular">regular</span> (hypothetical and real form are equivalent)'
+        elif regularity_class == 'morphologically_irregular':
+            regularity_html = '<span class="morphologically">morphologically irregular</span> (form does not follow standard conjugation rules)'
+        else:
+            regularity_html = '<span class="orthographically">orthographically irregular</span> (spoken word is regular, but spelling is irregular)'
+        
+        extra_parts.append(f"<strong>Hypothetical regular form:</strong> {hypothetical_regular_conjugation}<br>")
+        extra_parts.append(f"<strong>Regularity class:</strong> {regularity_html}<br>")
+        extra_parts.extend(details)
+        
+        extra_parts.append('<div class="contact-info">Any questions/problems/suggestions regarding this deck? You may reach out to the creator through hex5e@outlook.com</div>')
+        extra_parts.append('</div>')
+        
+        return ''.join(extra_parts)
+    
     # Create the cloze model
     log("Creating Anki cloze model...")
     cloze_model = genanki.Model(
@@ -267,17 +317,7 @@ def main():
                 matched_text = match.group()
                 
                 # Create hint text
-                person_text = person_map.get(row['person'], '')
-                form_symbol = form_symbol_map.get(row['form'], '')
-                
-                if person_text and form_symbol:
-                    hint_text = f"{form_symbol}...{person_text}...{row['verb']}...{person_text}...{form_symbol}"
-                elif person_text:
-                    hint_text = f"{person_text}...{row['verb']}...{person_text}"
-                elif form_symbol:
-                    hint_text = f"{form_symbol}...{row['verb']}...{form_symbol}"
-                else:
-                    hint_text = f"{row['verb']}"
+                hint_text = make_hint(row['verb'], row['form'], row['person'])
                 
                 # Create cloze sentence
                 start, end = match.span()
@@ -300,30 +340,19 @@ def main():
                 text_field = ''.join(verb_info_parts) + cloze_sentence
                 
                 # Build extra info
-                extra_parts = ['<div class="extra-info">']
-                
-                if row['regularity_class'] == 'regular':
-                    regularity_html = '<span class="regular">regular</span> (hypothetical and real form are equivalent)'
-                elif row['regularity_class'] == 'morphologically_irregular':
-                    regularity_html = '<span class="morphologically">morphologically irregular</span> (form does not follow standard conjugation rules)'
-                else:
-                    regularity_html = '<span class="orthographically">orthographically irregular</span> (spoken word is regular, but spelling is irregular)'
-                
-                extra_parts.append(f"<strong>Hypothetical regular form:</strong> {row['hypothetical_regular_conjugation']}<br>")
-                extra_parts.append(f"<strong>Regularity class:</strong> {regularity_html}<br>")
-                extra_parts.append(f"<strong>Conjugation ID:</strong> {row['conjugation_id']}")
+                details = [f"<strong>Conjugation ID:</strong> {row['conjugation_id']}"]
                 
                 # Handle audio
                 if row.get('audio_path'):
                     audio_filename = row['audio_path'].replace('\\', '/')
                     audio_file_only = audio_filename.split('/')[-1]
-                    extra_parts.append(f"<br><br>[sound:{audio_file_only}]")
+                    details.append(f"<br><br>[sound:{audio_file_only}]")
                     media_files.append(row['audio_path'])
                 
-                extra_parts.append('<div class="contact-info">Any questions/problems/suggestions regarding this deck? You may reach out to the creator through hex5e@outlook.com</div>')
-                extra_parts.append('</div>')
-                
-                extra_field = ''.join(extra_parts)
+                extra_field = make_extra_field(
+                    row['hypothetical_regular_conjugation'],
+                    row['regularity_class'],
+                    details)
                 
                 # Create note with tags
                 note = genanki.Note(
@@ -353,6 +382,38 @@ def main():
     
     log(f"Card creation complete. Created {cards_created} cards, skipped {len(problematic_rows)} problematic rows")
     
+    # Compound tenses are derived from the stored participio/gerundio rows
+    # and the haber/estar paradigms while the deck is built; they are not
+    # stored in cards.db.
+    log("Deriving compound tense cards...")
+    compound_created = 0
+    deriver = CompoundTenseDeriver.from_db('cards.db')
+    for derived in deriver.iter_forms():
+        person_text = person_map[derived['person']]
+        form_display = form_display_map[derived['form']]
+        hint_text = make_hint(derived['verb'], derived['form'], derived['person'])
+        text_field = (
+            f"<div class='verb-header'>{derived['verb']}</div>"
+            f"<div class='person-info'>{person_text}</div>"
+            f"<div class='form-info'>{form_display}</div>"
+            f"{person_text} {{{{c1::{derived['conjugation']}::{hint_text}}}}}"
+        )
+        extra_field = make_extra_field(
+            derived['hypothetical_regular_conjugation'],
+            derived['regularity_class'],
+            ['<strong>Compound tense:</strong> derived from the stored participio/gerundio'])
+        note = genanki.Note(
+            model=cloze_model,
+            fields=[text_field, extra_field])
+        note.tags = [
+            f"verb::{derived['verb']}",
+            f"form::{derived['form']}",
+            f"person::{derived['person']}",
+        ]
+        cloze_deck.add_note(note)
+        compound_created += 1
+    log(f"Created {compound_created} compound tense cards")
+    
     # Create package
     log("Creating Anki package...")
     package = genanki.Package(cloze_deck)
@@ -392,6 +453,7 @@ def main():
     log("SUMMARY:")
     log(f"Total execution time: {elapsed_time:.2f} seconds")
     log(f"Cards created: {cards_created}")
+    log(f"Compound tense cards created: {compound_created}")
     log(f"Problematic rows skipped: {len(problematic_rows)}")
     log(f"Media files added: {media_added}")
     log(f"Missing audio files: {len(missing_audio_files)}")
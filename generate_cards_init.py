@@ -1,23 +1,28 @@
 import csv
+import os
 import sqlite3
 from pathlib import Path
 
-from utilities.regular_form_generator import RegularFormGenerator
+from utilities import paradigm_cache
+from utilities.classification_memo import ClassificationMemo
+from utilities.compound_tenses import CompoundTenseDeriver
 from utilities.conjugation_regularity_classifier import (
     ConjugationRegularityClassifier,
 )
 from utilities.get_conjugation_rae import (
+    DEFAULT_WORKERS,
     RAEConjugationFetcher,
-    RAEConjugationTransformer,
     strip_reflexive,
 )
+from utilities.raw_store import RawConjugationStore, transform_all
 
-# instantiate a single generator for regular forms
-generator = RegularFormGenerator()
 classifier = ConjugationRegularityClassifier()
 
 verbs_dictionary_conjugations = {}
 
+# Concurrent RAE page fetches (set RAE_FETCH_WORKERS=1 to fetch sequentially)
+FETCH_WORKERS = int(os.environ.get("RAE_FETCH_WORKERS", DEFAULT_WORKERS))
+
 # Columns for the output CSV
 FIELDNAMES = [
     "verb_id",
@@ -81,8 +86,33 @@ def load_csv_data(filename, id_column, value_column):
     return data
 
 
+def load_stored_rows(db_path, verbs):
+    """Return ``{verb: [row, ...]}`` of the ``cards`` rows stored for ``verbs``."""
+    stored = {}
+    if not verbs or not Path(db_path).exists():
+        return stored
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='cards'"
+        ).fetchone():
+            return stored
+        placeholders = ",".join("?" * len(verbs))
+        for row in conn.execute(
+            f"SELECT * FROM cards WHERE verb IN ({placeholders}) ORDER BY rowid",
+            list(verbs),
+        ):
+            stored.setdefault(row["verb"], []).append(dict(row))
+    finally:
+        conn.close()
+    return stored
+
+
 def generate_conjugation_table():
     """Generate the main conjugation table"""
+    output_filename = "cards.db"
+
     # Try to load from CSV files first
     try:
         verbs = load_csv_data(Path("verb_data") / "verbs.csv", "verb_id", "verb")
@@ -95,21 +125,96 @@ def generate_conjugation_table():
         print("CSV files not found.")
         return
 
-    # Populate verbs_dictionary_conjugations using the RAE crawler
+    # Populate verbs_dictionary_conjugations using the RAE crawler.  Parsed
+    # tables are kept in the rae_raw table per base verb; only base verbs
+    # without a current entry are fetched, once each however many variants
+    # ("levantar", "levantarse") share them, concurrently within the
+    # fetcher's rate limit.  Expired pages are revalidated with conditional
+    # requests, and a page whose digest matches its expired entry is not
+    # parsed again.  A verb that still fails after retries falls back to
+    # its expired entry, if any, and otherwise keeps its stored cards rows.
     fetcher = RAEConjugationFetcher()
-    for _, verb in verbs:
-        base, is_reflexive = strip_reflexive(verb)
-        try:
-            raw = fetcher.get_conjugation(base)
-            transformer = RAEConjugationTransformer(verb, is_reflexive=is_reflexive)
-            verbs_dictionary_conjugations[verb] = transformer.transform(raw)
-        except Exception as exc:  # pragma: no cover - network call
-            raise RuntimeError(f"Failed to fetch conjugations for {verb}") from exc
+    raw_store = RawConjugationStore(output_filename)
+    raws = raw_store.load(max_age=fetcher.cache.ttl if fetcher.cache else None)
+    stripped = [strip_reflexive(verb) for _, verb in verbs]
+    needed = [base for base, _ in stripped if base not in raws]
+    missing = list(dict.fromkeys(needed))
+    expired = raw_store.load_entries() if missing else {}
+    fetcher.known_parses = expired
+    failures = {}
+    fetched = fetcher.get_conjugations(
+        missing, workers=FETCH_WORKERS, return_exceptions=True
+    )
+    try:
+        for base, raw in zip(missing, fetched):
+            if isinstance(raw, Exception):
+                failures[base] = raw
+                if base in expired:
+                    raws[base] = expired[base][1]
+                continue
+            raws[base] = raw
+            raw_store.put(
+                base, raw, fetcher.fetched_at.get(base), fetcher.page_sha256.get(base)
+            )
+    finally:
+        raw_store.save()  # keep what was fetched even if the run is interrupted
+    verbs_dictionary_conjugations.update(
+        transform_all(raws, [verb for _, verb in verbs])
+    )
+    # Variants of a base verb that was fetched once for all of them
+    fetched_ok = len(missing) - len(failures)
+    shared = sum(1 for base in needed if base not in failures) - fetched_ok
+    print(
+        f"{len(verbs) - len(needed)} verbs replayed from rae_raw, "
+        f"{fetched_ok} pages fetched, "
+        f"{shared} fetches saved by sharing base verbs"
+    )
+    fetch_stats = fetcher.stats.summary()
+    if fetch_stats["requests"]:
+        print(
+            f"RAE requests: {fetch_stats['requests']}, "
+            f"retries: {fetch_stats['retries']}, "
+            f"failures: {fetch_stats['failures']}, "
+            f"not modified: {fetch_stats['not_modified']}, "
+            f"unchanged pages not re-parsed: {fetch_stats['unchanged']}, "
+            f"latency mean {fetch_stats['latency_mean']:.2f}s / "
+            f"max {fetch_stats['latency_max']:.2f}s, "
+            f"circuit breaker trips: {fetcher.breaker.trips}"
+        )
+    for base, exc in failures.items():
+        fallback = "using expired entry" if base in raws else "keeping stored rows"
+        print(f"Failed to fetch {base} ({fallback}): {type(exc).__name__}: {exc}")
+
+    # Verbs without tables keep the rows already in cards; refuse to rewrite
+    # the table if any of them has none.
+    unavailable = [
+        verb for _, verb in verbs if verb not in verbs_dictionary_conjugations
+    ]
+    stored_rows = load_stored_rows(output_filename, unavailable)
+    lost = [verb for verb in unavailable if verb not in stored_rows]
+    if lost:
+        raise RuntimeError(
+            f"No conjugation tables or stored rows for {len(lost)} verb(s) "
+            f"({', '.join(lost[:10])}); {output_filename} was not modified"
+        )
+
+    # Reuse classifier decisions from earlier builds
+    classifier.memo = ClassificationMemo()
+
+    # Regular paradigms come from the compiled artifact, rebuilt when stale
+    regular_grids = paradigm_cache.load(Path("verb_data") / "verbs.csv")
 
     # Generate the conjugation table
     conjugation_table = []
 
     for verb_id, verb in verbs:
+        if verb in stored_rows:
+            conjugation_table.extend(stored_rows[verb])
+            continue
+        regular_grid = regular_grids[verb]
+        cell_classes, _ = classifier.classify_paradigm(
+            verb, verbs_dictionary_conjugations.get(verb, {}), regular_grid
+        )
         for form_id, form in forms:
             # Skip participio for reflexive verbs
             if form_id == 2 and verb.endswith("se"):
@@ -145,7 +250,7 @@ def generate_conjugation_table():
 
             for person_id, person in applicable_persons:
                 # Generate hypothetical regular conjugation
-                regular_conjugation = generator.generate(verb, form, person)
+                regular_conjugation = regular_grid[form_id][person_id]
 
                 # Look up the real conjugation from the scraped data
                 form_map = verbs_dictionary_conjugations.get(verb, {}).get(form)
@@ -164,15 +269,14 @@ def generate_conjugation_table():
                     conjugation_id=f"{verb_id}_{form_id}_{person_id}",
                     hypothetical_regular_conjugation=regular_conjugation,
                     conjugation=conjugation,
-                    regularity_class=classifier.classify(
-                        verb, {form: {person: conjugation}}
+                    regularity_class=cell_classes.get(form, {}).get(person)
+                    or classifier.classify_id(
+                        verb, form_id, person_id, conjugation, regular_grid
                     ),
                 )
                 conjugation_table.append(row)
 
     # Write to SQLite database
-    output_filename = "cards.db"
-
     conn = sqlite3.connect(output_filename)
     cur = conn.cursor()
     cur.execute("DROP TABLE IF EXISTS cards")
@@ -222,6 +326,7 @@ def generate_conjugation_table():
     )
     conn.commit()
     conn.close()
+    classifier.memo.save()
 
     # Calculate statistics
     reflexive_count = sum(1 for _, verb in verbs if verb.endswith("se"))
@@ -233,6 +338,22 @@ def generate_conjugation_table():
     print(f"- Total verbs: {len(verbs)}")
     print(f"  - Non-reflexive verbs: {non_reflexive_count}")
     print(f"  - Reflexive verbs: {reflexive_count}")
+    if stored_rows:
+        print(f"  - Kept stored rows (no tables): {len(stored_rows)}")
+
+    # Compound tenses are derived on demand from the rows above, not stored
+    deriver = CompoundTenseDeriver(
+        (row["verb"], row["form"], row["person"], row["conjugation"])
+        for row in conjugation_table
+    )
+    compound_count = sum(1 for _ in deriver.iter_forms())
+    print(f"- Compound tense forms derivable on demand: {compound_count}")
+
+    memo_stats = classifier.memo.stats()
+    print(
+        f"- Classification memo: {memo_stats['hits']} hits, "
+        f"{memo_stats['misses']} misses ({memo_stats['hit_rate']:.1%})"
+    )
 
     # Show sample rows with regular conjugations
     print("\nSample rows with hypothetical regular conjugations:")
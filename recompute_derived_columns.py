@@ -0,0 +1,148 @@
+"""Recompute the derived columns of ``cards.db`` in place.
+
+``hypothetical_regular_conjugation`` and ``regularity_class`` are derived
+from the stored ``conjugation`` values by :class:`RegularFormGenerator` and
+:class:`ConjugationRegularityClassifier`.  After a fix to either, this script
+refreshes just those two columns without re-scraping RAE or rebuilding the
+table.  All updates run in one transaction, and every changed row is
+reported.
+
+Example::
+
+    python recompute_derived_columns.py --dry-run
+
+"""
+
+import argparse
+import sqlite3
+import time
+
+from utilities.classification_memo import ClassificationMemo
+from utilities.conjugation_regularity_classifier import (
+    ConjugationRegularityClassifier,
+)
+from utilities.regular_form_generator import RegularFormGenerator
+
+BATCH_SIZE = 500
+
+
+def recompute(
+    db_path="cards.db", dry_run=False, batch_size=BATCH_SIZE, use_memo=True
+):
+    """Recompute the derived columns.
+
+    Returns ``(rows_checked, changes, memo_stats)``.  Each change is
+    ``(conjugation_id, verb, form, person, old, new)`` where ``old`` and
+    ``new`` are ``(hypothetical_regular_conjugation, regularity_class)``
+    pairs.  Only the ``cards`` table is written; the memo is kept in its own
+    file under ``build/``.  With ``dry_run`` nothing is written, including
+    the memo.
+    """
+    generator = RegularFormGenerator()
+    memo = ClassificationMemo() if use_memo else None
+    classifier = ConjugationRegularityClassifier(memo=memo)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            """
+            SELECT conjugation_id, verb, form_id, form, person_id, person,
+                   hypothetical_regular_conjugation, conjugation, regularity_class
+            FROM cards
+            ORDER BY rowid
+            """
+        ).fetchall()
+
+        grids = {}
+        changes = []
+        for (
+            conjugation_id,
+            verb,
+            form_id,
+            form,
+            person_id,
+            person,
+            old_regular,
+            conjugation,
+            old_class,
+        ) in rows:
+            grid = grids.get(verb)
+            if grid is None:
+                grid = grids[verb] = generator.generate_paradigm_ids(verb)
+            regular = grid[form_id][person_id]
+            regularity_class = classifier.classify_id(
+                verb, form_id, person_id, conjugation or "", grid
+            )
+            if (regular, regularity_class) != (old_regular, old_class):
+                changes.append(
+                    (
+                        conjugation_id,
+                        verb,
+                        form,
+                        person,
+                        (old_regular, old_class),
+                        (regular, regularity_class),
+                    )
+                )
+
+        if changes and not dry_run:
+            updates = [
+                (regular, regularity_class, conjugation_id)
+                for conjugation_id, _, _, _, _, (regular, regularity_class) in changes
+            ]
+            with conn:
+                for start in range(0, len(updates), batch_size):
+                    conn.executemany(
+                        "UPDATE cards SET hypothetical_regular_conjugation=?, "
+                        "regularity_class=? WHERE conjugation_id=?",
+                        updates[start : start + batch_size],
+                    )
+    finally:
+        conn.close()
+    if memo is None:
+        return len(rows), changes, None
+    if not dry_run:
+        memo.save()
+    return len(rows), changes, memo.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute hypothetical_regular_conjugation and regularity_class"
+    )
+    parser.add_argument("--db", default="cards.db", help="Path to the cards database")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report changes without writing them"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=BATCH_SIZE, help="Rows per UPDATE batch"
+    )
+    parser.add_argument(
+        "--no-memo", action="store_true", help="Ignore the classification memo"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    total, changes, memo_stats = recompute(
+        args.db, args.dry_run, args.batch_size, use_memo=not args.no_memo
+    )
+    elapsed = time.perf_counter() - start
+
+    for conjugation_id, verb, form, person, old, new in changes:
+        print(f"{conjugation_id} {verb} {form} {person}")
+        if old[0] != new[0]:
+            print(f"    hypothetical_regular_conjugation: {old[0]!r} -> {new[0]!r}")
+        if old[1] != new[1]:
+            print(f"    regularity_class: {old[1]} -> {new[1]}")
+    action = "would change" if args.dry_run else "changed"
+    print(f"{total} rows checked, {len(changes)} {action} in {elapsed:.2f}s")
+    if memo_stats:
+        print(
+            f"Classification memo: {memo_stats['hits']} hits, "
+            f"{memo_stats['misses']} misses ({memo_stats['hit_rate']:.1%}), "
+            f"{memo_stats['size']} entries"
+        )
+
+
+if __name__ == "__main__":
+    main()
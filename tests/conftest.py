@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities import phonology
+from utilities.get_conjugation_rae import RAEConjugationFetcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status, text="", headers=None):
+        self.status_code = status
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class FakeScraper:
+    """Answer requests in turn with ``responses``, statuses or responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []  # headers of each request
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        response = self.responses.pop(0)
+        if isinstance(response, int):
+            response = FakeResponse(response, f"<html>{url}</html>")
+        return response
+
+
+@pytest.fixture(autouse=True)
+def reset_phonology():
+    """Drop syllabifications preloaded by a test, e.g. by paradigm_cache.load."""
+    yield
+    phonology.set_backend(phonology.get_backend())
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def use_scraper(monkeypatch):
+    """Return a function that makes every fetcher use the given scraper."""
+
+    def use(scraper):
+        monkeypatch.setattr(
+            RAEConjugationFetcher, "scraper", property(lambda self: scraper)
+        )
+        return scraper
+
+    return use
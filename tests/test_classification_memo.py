@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.classification_memo import TABLE, ClassificationMemo
+from utilities.conjugation_regularity_classifier import (
+    ConjugationRegularityClassifier,
+)
+
+PAIRS = [("buscé", "busqué"), ("penso", "pienso"), ("llegé", "llegué")]
+
+
+def _classify(memo):
+    classifier = ConjugationRegularityClassifier(memo=memo)
+    return [classifier._classify_cell(r, a) for r, a in PAIRS]
+
+
+def test_memo_hits_after_save(tmp_path):
+    db = tmp_path / "build" / "memo.db"  # created on save
+    memo = ClassificationMemo(db)
+    first = _classify(memo)
+    assert memo.stats()["misses"] == 3 and memo.stats()["hits"] == 0
+    memo.save()
+
+    memo = ClassificationMemo(db)
+    assert _classify(memo) == first
+    assert memo.stats() == {"hits": 3, "misses": 0, "hit_rate": 1.0, "size": 3}
+
+
+def test_memo_invalidates_other_versions_and_is_bounded(tmp_path):
+    db = str(tmp_path / "memo.db")
+    old = ClassificationMemo(db, version="old")
+    _classify(old)
+    old.save()
+
+    memo = ClassificationMemo(db, version="new", max_entries=2)
+    assert memo.stats()["size"] == 0
+    _classify(memo)
+    memo.save()
+    with sqlite3.connect(db) as conn:
+        versions = conn.execute(f"SELECT version FROM {TABLE}").fetchall()
+    assert versions == [("new",), ("new",)]
+
+
+def test_memo_reads_without_creating_table(tmp_path):
+    db = str(tmp_path / "memo.db")
+    ClassificationMemo(db)
+    with sqlite3.connect(db) as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+    assert tables == []
+
+
+def test_batch_workers_use_and_fill_the_memo(tmp_path):
+    rows = [
+        ("buscar", "indicativo_preterito", "1st_singular", "busqué"),
+        ("pensar", "indicativo_presente", "1st_singular", "pienso"),
+        ("llegar", "indicativo_preterito", "1st_singular", "llegué"),
+        ("hablar", "indicativo_presente", "1st_singular", "hablo"),
+    ]
+    runs = {}
+    for workers in (1, 2):
+        db = tmp_path / f"memo{workers}.db"
+        memo = ClassificationMemo(db)
+        classifier = ConjugationRegularityClassifier(memo=memo)
+        classes = list(classifier.classify_batch(rows, workers=workers, chunk_size=1))
+        first = memo.stats()
+        memo.save()
+
+        memo = ClassificationMemo(db)
+        classifier = ConjugationRegularityClassifier(memo=memo)
+        assert list(classifier.classify_batch(rows, workers=workers)) == classes
+        runs[workers] = (classes, first, memo.stats())
+
+    assert runs[1] == runs[2]
+    assert runs[2][1] == {"hits": 0, "misses": 3, "hit_rate": 0.0, "size": 3}
+    assert runs[2][2] == {"hits": 3, "misses": 0, "hit_rate": 1.0, "size": 3}
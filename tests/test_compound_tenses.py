@@ -0,0 +1,101 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.compound_tenses import CompoundTenseDeriver
+
+ROWS = [
+    ("haber", "indicativo_presente", "1st_singular", "he"),
+    ("haber", "indicativo_presente", "3rd_plural", "han"),
+    ("haber", "indicativo_imperfecto", "2nd_plural", "habíais"),
+    ("estar", "indicativo_presente", "1st_singular", "estoy"),
+    ("hablar", "participio", "not_applicable", "hablado"),
+    ("hablar", "gerundio", "not_applicable", "hablando"),
+    ("hablar", "indicativo_presente", "1st_singular", "hablo"),
+    ("hablar", "indicativo_presente", "3rd_plural", "hablan"),
+    ("levantar", "participio", "not_applicable", "levantado"),
+    ("levantarse", "gerundio", "not_applicable", "levantándose"),
+    ("levantarse", "indicativo_presente", "1st_singular", "me levanto"),
+    ("levantarse", "indicativo_presente", "2nd_plural", "os levantáis"),
+    ("gustar", "participio", "not_applicable", "gustado"),
+    ("gustar", "indicativo_presente", "3rd_plural", "gustan"),
+]
+
+
+def test_derive_compound_tenses():
+    deriver = CompoundTenseDeriver(ROWS)
+    assert deriver.derive("hablar", "indicativo_perfecto", "1st_singular") == "he hablado"
+    assert (
+        deriver.derive("hablar", "indicativo_presente_progresivo", "1st_singular")
+        == "estoy hablando"
+    )
+    assert (
+        deriver.derive("levantarse", "indicativo_pluscuamperfecto", "2nd_plural")
+        == "os habíais levantado"
+    )
+    assert (
+        deriver.derive("levantarse", "indicativo_presente_progresivo", "1st_singular")
+        == "me estoy levantando"
+    )
+
+
+def test_missing_forms_and_persons_are_skipped():
+    deriver = CompoundTenseDeriver(ROWS)
+    assert deriver.derive("hablar", "indicativo_futuro_perfecto", "1st_singular") is None
+    assert deriver.derive("gustar", "indicativo_perfecto", "1st_singular") is None
+    assert deriver.derive("gustar", "indicativo_perfecto", "3rd_plural") == "han gustado"
+
+
+def test_iter_forms_is_lazy():
+    forms = CompoundTenseDeriver(ROWS).iter_forms(verbs=["hablar"])
+    assert next(forms) == {
+        "verb": "hablar",
+        "form": "indicativo_perfecto",
+        "person": "1st_singular",
+        "conjugation": "he hablado",
+        "hypothetical_regular_conjugation": None,
+        "regularity_class": None,
+    }
+    assert {row["conjugation"] for row in forms} == {"han hablado", "estoy hablando"}
+
+
+def test_auxiliaries_have_no_progressive_tenses():
+    rows = ROWS + [
+        ("haber", "gerundio", "not_applicable", "habiendo"),
+        ("haber", "participio", "not_applicable", "habido"),
+        ("estar", "gerundio", "not_applicable", "estando"),
+        ("estar", "participio", "not_applicable", "estado"),
+        ("estar", "indicativo_presente", "1st_singular", "estoy"),
+    ]
+    deriver = CompoundTenseDeriver(rows)
+    assert deriver.derive("estar", "indicativo_perfecto", "1st_singular") == "he estado"
+    for verb in ("haber", "estar"):
+        assert not [
+            row
+            for row in deriver.iter_forms(verbs=[verb])
+            if row["form"].endswith("_progresivo")
+        ]
+
+
+def test_regularity_comes_from_the_source_form():
+    rows = ROWS + [
+        (
+            "poner",
+            "participio",
+            "not_applicable",
+            "puesto",
+            "ponido",
+            "morphologically_irregular",
+        ),
+        ("poner", "indicativo_presente", "3rd_plural", "ponen", "ponen", "regular"),
+    ]
+    deriver = CompoundTenseDeriver(rows)
+    assert deriver.regularity_of("poner", "indicativo_perfecto", "3rd_plural") == (
+        "han ponido",
+        "morphologically_irregular",
+    )
+    assert deriver.regularity_of("hablar", "indicativo_perfecto", "3rd_plural") == (
+        None,
+        None,
+    )
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from utilities.conjugation_regularity_classifier import (
     ConjugationRegularityClassifier,
+    phonetic_key,
 )
 
 classifier = ConjugationRegularityClassifier()
@@ -73,3 +74,84 @@ def test_reflexive_imperative_levantarse():
 def test_reflexive_imperative_echarse():
     forms = {"imperativo_afirmativo": {"2nd_singular": "échate"}}
     assert classifier.classify("echarse", forms) == "regular"
+
+
+def test_classify_with_precomputed_paradigm():
+    paradigm = classifier.generator.generate_paradigm("buscar")
+    forms = {
+        "indicativo_presente": {"1st_singular": "busco"},
+        "indicativo_preterito": {"1st_singular": "busqué"},
+    }
+    assert (
+        classifier.classify("buscar", forms, paradigm) == "orthographically_irregular"
+    )
+
+
+def test_classify_id():
+    grid = classifier.generator.generate_paradigm_ids("buscar")
+    assert classifier.classify_id("buscar", 3, 11, "busco", grid) == "regular"
+    assert (
+        classifier.classify_id("buscar", 4, 11, "busqué", grid)
+        == "orthographically_irregular"
+    )
+    assert (
+        classifier.classify_id("pensar", 3, 11, "pienso") == "morphologically_irregular"
+    )
+
+
+def test_orthographic_rule_names_the_match():
+    assert classifier.orthographic_rule("busqué", "busqué") is None
+    assert classifier.orthographic_rule("buscé", "busqué") == "c_to_qu"
+    assert classifier.orthographic_rule("llegé", "llegué") == "g_to_gu"
+    assert classifier.orthographic_rule("distinguo", "distingo") == "guir_drop_u"
+    assert classifier.orthographic_rule("venco", "venzo") == "c_to_z_after_consonant"
+    assert classifier.orthographic_rule("envio", "envío") == "accent_shift"
+    assert classifier.orthographic_rule("penso", "pienso") is None
+
+
+def test_phonetic_keys():
+    assert phonetic_key("buscé")[0] == phonetic_key("busqué")[0]
+    assert phonetic_key("protego")[1] == phonetic_key("protejo")[1]
+    assert phonetic_key("leió")[2] == phonetic_key("leyó")[2]
+    assert classifier._classify_cell("delinquo", "delinco") == (
+        "morphologically_irregular"
+    )
+    # Two families at once (z/c and a written accent) is not orthographic.
+    assert classifier._classify_cell("europeize", "europeíce") == (
+        "morphologically_irregular"
+    )
+
+
+def test_classify_paradigm():
+    paradigm = {
+        "infinitivo": "buscar",
+        "indicativo_presente": {"1st_singular": "busco", "3rd_singular": "busca"},
+        "indicativo_preterito": {"1st_singular": "busqué"},
+    }
+    classes, summary = classifier.classify_paradigm("buscar", paradigm)
+    assert classes == {
+        "infinitivo": {"not_applicable": "regular"},
+        "indicativo_presente": {"1st_singular": "regular", "3rd_singular": "regular"},
+        "indicativo_preterito": {"1st_singular": "orthographically_irregular"},
+    }
+    assert summary == "orthographically_irregular"
+    assert summary == classifier.classify(
+        "buscar", {k: v for k, v in paradigm.items() if isinstance(v, dict)}
+    )
+
+
+def test_classify_batch_keeps_order():
+    rows = [
+        ("buscar", "indicativo_preterito", "1st_singular", "busqué"),
+        ("pensar", 3, 11, "pienso"),
+        ("buscar", "indicativo_presente", "1st_singular", "busco"),
+        ("hablar", "infinitivo", "not_applicable", "hablar"),
+    ]
+    expected = [
+        "orthographically_irregular",
+        "morphologically_irregular",
+        "regular",
+        "regular",
+    ]
+    assert list(classifier.classify_batch(rows, workers=1)) == expected
+    assert list(classifier.classify_batch(rows, workers=2, chunk_size=1)) == expected
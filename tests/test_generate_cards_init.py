@@ -0,0 +1,50 @@
+import os
+import shutil
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, ROOT)
+
+import generate_cards_init
+from utilities import classification_memo
+
+
+def cards(db):
+    with sqlite3.connect(db) as conn:
+        return conn.execute("SELECT * FROM cards ORDER BY rowid").fetchall()
+
+
+@pytest.fixture
+def build_dir(tmp_path, monkeypatch):
+    """A copy of the repo's inputs with every RAE fetch failing."""
+    shutil.copytree(os.path.join(ROOT, "verb_data"), tmp_path / "verb_data")
+    shutil.copy(os.path.join(ROOT, "cards.db"), tmp_path / "cards.db")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RAE_OFFLINE", "1")
+    monkeypatch.setenv("RAE_CACHE_DIR", str(tmp_path / "rae_cache"))
+    monkeypatch.setattr(classification_memo, "MEMO_PATH", tmp_path / "memo.db")
+    monkeypatch.setattr(generate_cards_init, "verbs_dictionary_conjugations", {})
+    return tmp_path
+
+
+def test_failed_fetches_keep_stored_rows(build_dir, capsys):
+    before = cards(build_dir / "cards.db")
+
+    generate_cards_init.generate_conjugation_table()
+
+    assert cards(build_dir / "cards.db") == before
+    assert "0 pages fetched, 0 fetches saved" in capsys.readouterr().out
+
+
+def test_refuses_to_rewrite_without_tables_or_stored_rows(build_dir):
+    with sqlite3.connect(build_dir / "cards.db") as conn:
+        conn.execute("DELETE FROM cards WHERE verb='hablar'")
+    before = cards(build_dir / "cards.db")
+
+    with pytest.raises(RuntimeError, match="hablar"):
+        generate_cards_init.generate_conjugation_table()
+
+    assert cards(build_dir / "cards.db") == before
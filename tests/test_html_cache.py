@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from conftest import FakeResponse, FakeScraper
+from utilities.get_conjugation_rae import RAEConjugationFetcher
+from utilities.html_cache import HTMLCache, OfflineCacheMiss
+
+URL = "https://dle.rae.es/amar"
+
+
+def test_cache_round_trip_and_ttl(tmp_path):
+    cache = HTMLCache(tmp_path, ttl=60)
+    assert cache.load("amar", URL) is None
+    record = cache.put("amar", URL, "<html>amar</html>", etag='"v1"')
+    assert cache.load("amar", URL) == record
+    assert record["html"] == "<html>amar</html>" and record["etag"] == '"v1"'
+    assert cache.is_fresh(record)
+    assert cache.load("amar", "https://dle.rae.es/otro") is None
+
+    cache.ttl = 1e-9
+    time.sleep(0.01)
+    assert not cache.is_fresh(cache.load("amar", URL))
+    cache.ttl = 0  # no expiry
+    assert cache.is_fresh(cache.load("amar", URL))
+
+
+def test_offline_fetcher_uses_only_the_cache(tmp_path):
+    cache = HTMLCache(tmp_path, ttl=1e-9)
+    cache.put("amar", URL, "<html>amar</html>")
+    fetcher = RAEConjugationFetcher(cache=cache, offline=True)
+    assert fetcher.fetch_html("amar") == "<html>amar</html>"
+    with pytest.raises(OfflineCacheMiss):
+        fetcher.fetch_html("comer")
+    assert getattr(fetcher._local, "scraper", None) is None
+
+
+def test_expired_pages_are_revalidated(tmp_path, monkeypatch, use_scraper):
+    scraper = use_scraper(
+        FakeScraper(
+            [
+                FakeResponse(200, "<html>amar</html>", {"ETag": '"v1"'}),
+                FakeResponse(304),
+                FakeResponse(200, "<html>amar</html>"),
+            ]
+        )
+    )
+    cache = HTMLCache(tmp_path, ttl=60)
+    fetcher = RAEConjugationFetcher(cache=cache, offline=False, rate=1000)
+    assert fetcher.fetch_html("amar") == "<html>amar</html>"
+    digest = fetcher.page_sha256["amar"]
+    fetcher.known_parses = {"amar": (digest, {"parsed": "earlier"})}
+    monkeypatch.setattr(fetcher, "_parse_conjugation", lambda html: {"parsed": "now"})
+
+    cache.ttl = 1e-9
+    time.sleep(0.01)
+    assert fetcher.get_conjugation("amar") == {"parsed": "earlier"}
+    assert scraper.requests[1] == {"If-None-Match": '"v1"'}
+    assert cache.load("amar", URL)["etag"] == '"v1"'
+
+    time.sleep(0.01)
+    assert fetcher.get_conjugation("amar") == {"parsed": "earlier"}  # same content
+    fetcher.known_parses = {"amar": ("other", {"parsed": "earlier"})}
+    cache.ttl = 60
+    assert fetcher.get_conjugation("amar") == {"parsed": "now"}
+
+    stats = fetcher.stats.summary()
+    assert (stats["requests"], stats["not_modified"], stats["unchanged"]) == (3, 1, 2)
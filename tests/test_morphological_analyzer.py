@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.morphological_analyzer import MorphologicalAnalyzer
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cards.db")
+
+analyzer = MorphologicalAnalyzer(DB_PATH)
+
+
+def test_regular_and_stored_forms():
+    assert analyzer.analyze("hablaremos") == [
+        ("hablar", "indicativo_futuro", "1st_plural")
+    ]
+    assert analyzer.analyze("pienso") == [
+        ("pensar", "indicativo_presente", "1st_singular")
+    ]
+    assert ("hablar", "indicativo_preterito", "1st_plural") in analyzer.analyze(
+        "hablamos"
+    )
+    assert analyzer.analyze("xyz") == []
+
+
+def test_irregular_verbs_do_not_get_regular_readings():
+    assert ("poner", "imperativo_afirmativo", "2nd_singular") not in (
+        analyzer.analyze("pone")
+    )
+
+
+def test_reflexive_and_negated_forms():
+    assert analyzer.analyze("me levanto") == [
+        ("levantarse", "indicativo_presente", "1st_singular")
+    ]
+    assert analyzer.analyze("no hables") == [
+        ("hablar", "imperativo_negativo", "2nd_singular")
+    ]
+
+
+def test_enclitic_forms():
+    assert ("levantarse", "imperativo_afirmativo", "2nd_singular") in (
+        analyzer.analyze("levántate")
+    )
+    assert analyzer.analyze("vámonos") == [
+        ("irse", "imperativo_afirmativo", "1st_plural")
+    ]
+    assert analyzer.analyze("dámelo") == [
+        ("dar", "imperativo_afirmativo", "2nd_singular")
+    ]
+
+
+def test_extra_lexicon():
+    custom = MorphologicalAnalyzer(DB_PATH, verbs=["vestirse", "sentarse"])
+    assert ("vestirse", "imperativo_afirmativo", "2nd_plural") in custom.analyze(
+        "vestíos"
+    )
+    assert ("sentarse", "imperativo_afirmativo", "1st_plural") in custom.analyze(
+        "sentémonos"
+    )
@@ -0,0 +1,40 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities import paradigm_cache
+from utilities.regular_form_generator import RegularFormGenerator
+
+
+def _write_verbs(path, verbs):
+    rows = ["verb_id,verb"] + [f"{i},{v}" for i, v in enumerate(verbs)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+
+def test_load_builds_and_reuses_artifact(tmp_path):
+    verbs = tmp_path / "verbs.csv"
+    artifact = tmp_path / "paradigms.pickle"
+    _write_verbs(verbs, ["hablar", "levantarse"])
+
+    grids = paradigm_cache.load(verbs, artifact)
+    assert artifact.exists()
+    generator = RegularFormGenerator()
+    assert grids["levantarse"] == generator.generate_paradigm_ids("levantarse")
+
+    mtime = artifact.stat().st_mtime_ns
+    assert paradigm_cache.load(verbs, artifact) == grids
+    assert artifact.stat().st_mtime_ns == mtime
+
+
+def test_load_rebuilds_when_stale(tmp_path):
+    verbs = tmp_path / "verbs.csv"
+    artifact = tmp_path / "paradigms.pickle"
+    _write_verbs(verbs, ["hablar"])
+    paradigm_cache.load(verbs, artifact)
+
+    _write_verbs(verbs, ["hablar", "comer"])
+    assert set(paradigm_cache.load(verbs, artifact)) == {"hablar", "comer"}
+
+    artifact.write_bytes(b"not a pickle")
+    assert set(paradigm_cache.load(verbs, artifact)) == {"hablar", "comer"}
@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities import phonology
+
+
+def test_stress_and_accent():
+    assert phonology.stress_index("levanta") == 1
+    assert phonology.stress_index("levantate") == 2
+    assert phonology.apply_accent("levantate", 1) == "levántate"
+
+
+def test_repeated_lookups_hit_cache():
+    phonology.cache_clear()
+    phonology.stress_index("echa")
+    phonology.stress_index("echa")
+    info = phonology.cache_info()["stress_index"]
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_attach_enclitics():
+    assert phonology.attach_enclitics("levanta", "te") == "levántate"
+    assert phonology.attach_enclitics("levantemos", "nos") == "levantémonos"
+    assert phonology.attach_enclitics("levantad", "os") == "levantaos"
+    assert phonology.attach_enclitics("vestid", "os", ending="ir") == "vestíos"
+    assert phonology.attach_enclitics("comer", "se") == "comerse"
+    assert phonology.attach_enclitics("da", "me", "lo") == "dámelo"
+    assert phonology.attach_enclitics("diga", "se", "lo") == "dígaselo"
+    assert phonology.attach_enclitics("dad", "nos", "lo") == "dádnoslo"
+
+
+def test_attach_enclitics_exceptions():
+    exceptions = {("vayamos", "nos"): "vámonos"}
+    assert (
+        phonology.attach_enclitics("vayamos", "nos", exceptions=exceptions)
+        == "vámonos"
+    )
+    assert phonology.attach_enclitics("vayamos", "nos") == "vayámonos"
@@ -0,0 +1,92 @@
+import gzip
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.get_conjugation_rae import (
+    RAEConjugationFetcher,
+    conjugation_section,
+    main,
+)
+from utilities.html_cache import HTMLCache
+
+PAGES = sorted((Path(__file__).parent / "rae_pages").glob("*.html.gz"))
+
+SECTION = (
+    '<div id="conjugacionXyZ" class="c-section">'
+    '<div class="c-collapse"><h3>Formas no personales</h3>'
+    "<table><tr><th>Infinitivo</th><th>Gerundio</th></tr>"
+    "<tr><td>amar</td><td>amando</td></tr></table></div>"
+    '<div class="c-collapse"><h3>Imperativo</h3><div><br/>'
+    "<table><tr><th></th><th></th><th></th><th>Imperativo</th></tr>"
+    "<tr><th>Singular</th><th>Segunda</th><td>tú / vos</td><td>ama / amá</td></tr>"
+    "</table></div></div></div>"
+)
+PAGE = (
+    '<html><body><div id="resultados"><article><div class="def">'
+    "<p>1. tr. Tener amor a alguien.</p><div></div></div></article>"
+    f'{SECTION}<div class="footer"><div>pie</div></div></div></body></html>'
+)
+
+
+def test_conjugation_section_cuts_out_the_nested_element():
+    assert conjugation_section(PAGE) == SECTION
+    assert conjugation_section("<html><body><p>nada</p></body></html>") is None
+
+
+def test_conjugation_section_skips_comments_scripts_and_quoted_attributes():
+    hazards = (
+        '<!-- </div></div> --><script>var s = "</div>";</script>'
+        '<span title="a > b" data-x=\'</div>\'></span>'
+    )
+    section = SECTION.replace("<h3>Imperativo</h3>", hazards + "<h3>Imperativo</h3>")
+    page = '<script>"<div id=\'conjugacionX\'>"</script>' + PAGE.replace(
+        SECTION, section
+    )
+    assert conjugation_section(page) == section
+
+
+def test_parse_conjugation_reads_only_the_section():
+    fetcher = RAEConjugationFetcher(cache=False, offline=True)
+    assert fetcher._parse_conjugation(PAGE) == {
+        "Formas no personales": {"Infinitivo": {"": "amar"}, "Gerundio": {"": "amando"}},
+        "Imperativo": {"Imperativo": {"tú / vos": "ama / amá"}},
+    }
+    assert fetcher._parse_conjugation("<html><body></body></html>") == {}
+
+
+@pytest.mark.parametrize("path", PAGES, ids=lambda p: p.name.split(".")[0])
+def test_section_parse_matches_full_page_parse(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        html = f.read()
+    fetcher = RAEConjugationFetcher(cache=False, offline=True)
+    parsed = fetcher._parse_conjugation(html)
+    assert parsed == fetcher._parse_conjugation(html, full_page=True)
+    assert list(parsed) == [
+        "Formas no personales",
+        "Indicativo",
+        "Subjuntivo",
+        "Imperativo",
+    ]
+
+
+def test_cli_streams_ndjson_per_verb(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("RAE_CACHE_DIR", str(tmp_path))
+    HTMLCache().put("amar", "https://dle.rae.es/amar", PAGE)
+    monkeypatch.setattr("sys.stdin", io.StringIO("amar\n# comentario\n\namarse\nxyz\n"))
+
+    assert main(["--offline"]) == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["verb"] for line in lines] == ["amar", "amarse", "xyz"]
+    assert lines[0]["conjugations"]["infinitivo"] == "amar"
+    assert lines[1]["conjugations"]["infinitivo"] == "amarse"
+    assert lines[2]["error"].startswith("OfflineCacheMiss")
+
+    assert main(["--offline", "amar"]) == 0
+    assert json.loads(capsys.readouterr().out)["gerundio"] == "amando"
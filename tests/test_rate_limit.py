@@ -0,0 +1,45 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.get_conjugation_rae import RAEConjugationFetcher
+from utilities.rate_limit import HostRateLimiter, TokenBucket
+
+
+def test_token_bucket_spaces_requests_after_burst(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.5, 0.5, 0.5]
+    assert clock.now == 1.5
+
+    clock.now += 10  # refills up to the capacity only
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_token_bucket_reserves_slots_for_concurrent_callers(clock):
+    slept = []
+    bucket = TokenBucket(rate=4.0, clock=clock, sleep=slept.append)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(slept) == [0.25, 0.5, 0.75]
+
+
+def test_host_rate_limiter_keeps_one_bucket_per_host():
+    limiter = HostRateLimiter(rate=1.0)
+    a = limiter.bucket("https://dle.rae.es/amar")
+    assert limiter.bucket("https://dle.rae.es/comer") is a
+    assert limiter.bucket("https://example.org/amar") is not a
+
+
+def test_get_conjugations_preserves_order():
+    fetcher = RAEConjugationFetcher(cache=False, offline=False)
+    verbs = [f"verbo{i}" for i in range(20)]
+    fetcher.fetch_html = lambda verb: verb
+    fetcher._parse_conjugation = lambda html: {"Formas no personales": html}
+    results = list(fetcher.get_conjugations(verbs, workers=4))
+    assert [r["Formas no personales"] for r in results] == verbs
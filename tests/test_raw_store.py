@@ -0,0 +1,67 @@
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities.raw_store import RawConjugationStore, transform_all
+
+RAW = {
+    "Formas no personales": {
+        "Infinitivo": {"": "levantar"},
+        "Gerundio": {"": "levantando"},
+        "Participio": {"": "levantado"},
+    },
+    "Indicativo": {
+        "Presente": {
+            "yo": "levanto",
+            "tú / vos": "levantas / levantás",
+            "usted": "levanta",
+            "él, ella": "levanta",
+            "nosotros, nosotras": "levantamos",
+            "vosotros, vosotras": "levantáis",
+            "ellos, ellas": "levantan",
+        }
+    },
+}
+
+
+def test_store_round_trip_and_versions(tmp_path):
+    db = str(tmp_path / "cards.db")
+    store = RawConjugationStore(db)
+    assert store.load() == {}
+    store.put("levantar", RAW)
+    store.put("viejo", RAW, fetched_at=time.time() - 3600)
+    store.save()
+
+    assert RawConjugationStore(db).load() == {"levantar": RAW, "viejo": RAW}
+    assert list(RawConjugationStore(db).load(max_age=60)) == ["levantar"]
+    assert RawConjugationStore(db, parser_version=-1).load() == {}
+
+
+def test_transform_all_replays_every_variant():
+    out = transform_all({"levantar": RAW}, ["levantar", "levantarse", "comer"])
+    assert sorted(out) == ["levantar", "levantarse"]
+    assert out["levantar"]["indicativo_presente"]["2nd_singular"] == "levantas"
+    assert out["levantarse"]["indicativo_presente"]["1st_plural"] == "nos levantamos"
+    assert out["levantarse"]["infinitivo"] == "levantarse"
+    assert RAW["Indicativo"]["Presente"]["yo"] == "levanto"
+
+
+def test_store_adds_page_digests_to_old_tables(tmp_path):
+    db = str(tmp_path / "cards.db")
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE rae_raw (verb TEXT PRIMARY KEY, raw TEXT, "
+            "fetched_at REAL, parser_version INTEGER)"
+        )
+        conn.execute(
+            "INSERT INTO rae_raw VALUES ('amar', '{}', ?, ?)",
+            (time.time(), RawConjugationStore(db).parser_version),
+        )
+    store = RawConjugationStore(db)
+    assert store.load_entries() == {"amar": (None, {})}
+    store.put("levantar", RAW, page_sha256="abc")
+    store.save()
+    assert RawConjugationStore(db).load_entries()["levantar"] == ("abc", RAW)
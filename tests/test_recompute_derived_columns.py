@@ -0,0 +1,50 @@
+import os
+import shutil
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, ROOT)
+
+from recompute_derived_columns import recompute
+from utilities import classification_memo
+
+
+def test_recompute_updates_only_stale_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(classification_memo, "MEMO_PATH", tmp_path / "memo.db")
+    db = tmp_path / "cards.db"
+    shutil.copy(os.path.join(ROOT, "cards.db"), db)
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "UPDATE cards SET hypothetical_regular_conjugation='x', "
+            "regularity_class='regular' WHERE verb='buscar' AND form_id=4 "
+            "AND person_id=11"
+        )
+        before = conn.execute("SELECT * FROM cards ORDER BY rowid").fetchall()
+
+    _, changes, _ = recompute(db, dry_run=True)
+    ids = {change[0] for change in changes}
+    assert any(c[1] == "buscar" and c[2] == "indicativo_preterito" for c in changes)
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT * FROM cards ORDER BY rowid").fetchall() == before
+
+    recompute(db)
+    with sqlite3.connect(db) as conn:
+        after = conn.execute("SELECT * FROM cards ORDER BY rowid").fetchall()
+        row = conn.execute(
+            "SELECT hypothetical_regular_conjugation, regularity_class FROM cards "
+            "WHERE verb='buscar' AND form_id=4 AND person_id=11"
+        ).fetchone()
+    assert row == ("buscé", "orthographically_irregular")
+    # Only the two derived columns of the reported rows differ.
+    for old, new in zip(before, after):
+        if old != new:
+            assert new[6] in ids
+            assert old[:7] + old[8:9] + old[10:] == new[:7] + new[8:9] + new[10:]
+    assert recompute(db)[1] == []
+    # The memo goes to its own file, not into cards.db.
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT name FROM sqlite_master").fetchall() == [
+            ("cards",)
+        ]
+    assert (tmp_path / "memo.db").exists()
@@ -903,3 +903,53 @@ def test_echarse_imperativo_afirmativo():
     assert gen.generate("echarse", "imperativo_afirmativo", "1st_plural") == "echémonos"
     assert gen.generate("echarse", "imperativo_afirmativo", "2nd_plural") == "echaos"
     assert gen.generate("echarse", "imperativo_afirmativo", "3rd_plural") == "échense"
+
+
+def test_generate_paradigm_matches_generate():
+    for verb in ["hablar", "deber", "vivir", "oír", "levantarse", "irse", "meterse"]:
+        paradigm = gen.generate_paradigm(verb)
+        assert len(paradigm) == 13
+        assert list(paradigm["imperativo_afirmativo"]) == [
+            "2nd_singular",
+            "3rd_singular",
+            "1st_plural",
+            "2nd_plural",
+            "3rd_plural",
+        ]
+        for form, cells in paradigm.items():
+            for person, value in cells.items():
+                assert value == gen.generate(verb, form, person)
+
+
+def test_generate_many_columns():
+    columns = gen.generate_many(
+        ["hablar", "comerse", "vivir"], forms=[3, "participio"], persons=[0, 11]
+    )
+    rows = set(zip(*columns.values()))
+    assert rows == {
+        ("hablar", 2, 0, "hablado"),
+        ("vivir", 2, 0, "vivido"),
+        ("hablar", 3, 11, "hablo"),
+        ("vivir", 3, 11, "vivo"),
+        ("comerse", 3, 11, "me como"),
+    }
+    assert gen.last_batch_stats["forms"] == 5
+
+
+def test_generate_many_matches_generate():
+    columns = gen.generate_many(["levantarse", "oír", "deber"])
+    for verb, form_id, person_id, value in zip(*columns.values()):
+        assert value == gen.generate(verb, form_id, person_id)
+
+
+def test_generate_id_and_grid():
+    assert gen.generate_id("hablar", 3, 11) == "hablo"
+    assert gen.generate_id("levantarse", 11, 21) == "levántate"
+    assert gen.generate_id("hablar", 11, 11) == ""
+    assert gen.generate_id("hablar", 99, 11) == ""
+    grid = gen.generate_paradigm_ids("meterse")
+    for form_id, form in gen.FORM_ID_TO_NAME.items():
+        for person_id, person in gen.PERSON_ID_TO_NAME.items():
+            if form_id <= 2 and person_id != 0:
+                continue
+            assert grid[form_id][person_id] == gen.generate("meterse", form, person)
@@ -0,0 +1,143 @@
+import os
+import sys
+import threading
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from conftest import FakeResponse, FakeScraper
+from utilities.get_conjugation_rae import RAEConjugationFetcher
+from utilities.retry import CircuitBreaker, CircuitOpen, RetryPolicy, is_transient
+
+
+def _fetcher(use_scraper, statuses, attempts=3):
+    scraper = use_scraper(FakeScraper(statuses))
+    fetcher = RAEConjugationFetcher(
+        cache=False,
+        offline=False,
+        rate=1000,
+        retry=RetryPolicy(attempts=attempts, base_delay=0),
+    )
+    return fetcher, scraper
+
+
+def test_retry_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert [policy.delay(n, rng=lambda: 1.0) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.delay(3, rng=lambda: 0.25) == 1.0
+
+
+def test_transient_errors():
+    assert is_transient(requests.ConnectionError())
+    assert is_transient(requests.HTTPError(response=FakeResponse(503)))
+    assert not is_transient(requests.HTTPError(response=FakeResponse(404)))
+    assert not is_transient(ValueError())
+
+
+def test_circuit_breaker_waits_out_cooldown_then_probes(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=30, clock=clock, sleep=clock.sleep)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.wait() == 0
+    breaker.record_failure()
+    assert breaker.is_open and breaker.trips == 1
+
+    assert breaker.wait() == 30  # cooldown, then this caller probes
+    breaker.record_success()
+    assert breaker.wait() == 0
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.wait() == 30  # a success came between the trips
+    assert breaker.trips == 2
+
+    breaker.record_failure()  # the probe fails: no success since the trip
+    with pytest.raises(CircuitOpen):
+        breaker.wait()
+    clock.now += 1e9
+    with pytest.raises(CircuitOpen):
+        breaker.wait()
+    assert breaker.trips == 3
+
+
+def _outage(use_scraper, clock, down):
+    """Fetch 150 verbs on 4 workers; the host answers 503 while ``down(breaker)``."""
+    lock = threading.Lock()
+    requests_made = []
+    slept = []
+
+    def sleep(seconds):
+        with lock:
+            slept.append(seconds)
+            clock.sleep(seconds)
+
+    class FlakyScraper:
+        def get(self, url, headers=None, timeout=None):
+            with lock:
+                requests_made.append(url)
+            status = 503 if down(breaker) else 200
+            return FakeResponse(status, f"<html>{url}</html>")
+
+    use_scraper(FlakyScraper())
+    breaker = CircuitBreaker(clock=clock, sleep=sleep)
+    fetcher = RAEConjugationFetcher(
+        cache=False,
+        offline=False,
+        rate=1000,
+        retry=RetryPolicy(sleep=sleep),
+        breaker=breaker,
+    )
+    verbs = [f"verbo{i}" for i in range(150)]
+    results = list(
+        fetcher.get_conjugations(verbs, workers=4, return_exceptions=True)
+    )
+    return fetcher, results, requests_made, slept
+
+
+def test_unreachable_host_fails_fast(use_scraper, clock):
+    fetcher, results, requests_made, slept = _outage(
+        use_scraper, clock, lambda breaker: True
+    )
+
+    assert all(isinstance(r, Exception) for r in results)
+    assert sum(isinstance(r, CircuitOpen) for r in results) >= 140
+    # One trip of 5 failures plus the requests in flight on the 4 workers,
+    # then a single probe whose failure keeps the breaker open.
+    assert len(requests_made) <= 5 + 4 + 1
+    assert sum(slept) < 120
+    assert fetcher.breaker.trips == 2
+    assert fetcher.stats.summary()["failures"] == 150
+
+
+def test_short_outage_pauses_and_recovers(use_scraper, clock):
+    # The host is down until the breaker trips and waits out its cooldown.
+    fetcher, results, requests_made, slept = _outage(
+        use_scraper, clock, lambda breaker: not breaker.trips or breaker.is_open
+    )
+
+    # Only a verb that was in flight when the outage began can have used up
+    # its attempts; every verb queued behind them waits and then succeeds.
+    assert not [r for r in results[4:] if isinstance(r, Exception)]
+    assert fetcher.stats.summary()["failures"] <= 1
+    assert fetcher.breaker.trips == 1
+    assert 60 <= sum(slept) < 120
+
+
+def test_fetch_retries_transient_failures(use_scraper):
+    fetcher, scraper = _fetcher(use_scraper, [503, 429, 200])
+    assert fetcher.fetch_html("amar") == "<html>https://dle.rae.es/amar</html>"
+    stats = fetcher.stats.summary()
+    assert (stats["requests"], stats["retries"], stats["failures"]) == (3, 2, 0)
+
+
+def test_fetch_gives_up_and_collects_failures(use_scraper):
+    fetcher, scraper = _fetcher(use_scraper, [404, 500, 500, 500])
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch_html("xyz")  # not found: no retry
+    assert scraper.calls == 1
+    results = list(fetcher.get_conjugations(["abc"], return_exceptions=True))
+    assert isinstance(results[0], requests.HTTPError)
+    assert scraper.calls == 4
+    assert fetcher.stats.summary()["failures"] == 2
@@ -0,0 +1,44 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from utilities import phonology
+from utilities.syllabifier import syllabify
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cards.db")
+
+# pyphen applies its "re-" prefix pattern here and splits re-i-mos.
+KNOWN_PYPHEN_DIFFERENCES = {"reimos"}
+
+
+def test_syllabify():
+    assert syllabify("instrumento") == ("ins", "tru", "men", "to")
+    assert syllabify("mucho") == ("mu", "cho")
+    assert syllabify("atlas") == ("at", "las")
+    assert syllabify("estoy") == ("es", "toy")
+    assert syllabify("ciudad") == ("ciu", "dad")
+    assert syllabify("sonríete") == ("son", "rí", "e", "te")
+    assert syllabify("averigüé") == ("a", "ve", "ri", "güé")
+
+
+def _stressed_forms(words):
+    phonology.cache_clear()
+    return {w: phonology.apply_accent(w, phonology.stress_index(w)) for w in words}
+
+
+def test_native_backend_agrees_with_pyphen_on_cards_db():
+    with sqlite3.connect(DB_PATH) as conn:
+        rows = conn.execute(
+            "SELECT conjugation, hypothetical_regular_conjugation FROM cards"
+        ).fetchall()
+    words = {w for row in rows for text in row for w in (text or "").split()}
+    words -= KNOWN_PYPHEN_DIFFERENCES
+
+    try:
+        phonology.set_backend("pyphen")
+        expected = _stressed_forms(words)
+    finally:
+        phonology.set_backend("native")
+    assert _stressed_forms(words) == expected
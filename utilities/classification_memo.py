@@ -0,0 +1,159 @@
+"""Persistent memo of classifier decisions keyed by ``(regular, actual)``.
+
+Many cells share the same pair of regular and actual forms across verbs and
+across rebuilds, so :class:`ConjugationRegularityClassifier` can consult a
+:class:`ClassificationMemo` before evaluating its rules.  Entries live in the
+``classification_memo`` table of ``build/classification_memo.db``, a sidecar
+kept out of git so that building or recomputing ``cards.db`` leaves only the
+``cards`` table changed:
+
+* every entry records the version it was computed with, a hash of the
+  generator and classifier sources; entries of other versions are dropped
+  when the memo is saved;
+* the table keeps at most ``max_entries`` rows, evicting the least recently
+  used ones;
+* :meth:`ClassificationMemo.stats` reports hits, misses and the hit rate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .paradigm_cache import generator_version
+
+MEMO_FORMAT = 1
+MAX_ENTRIES = 50000
+TABLE = "classification_memo"
+ROOT = Path(__file__).resolve().parent.parent
+MEMO_PATH = ROOT / "build" / "classification_memo.db"
+
+
+def memo_version() -> str:
+    """Return a hash of the code that decides a pair's class."""
+    digest = hashlib.sha256(f"{MEMO_FORMAT}:{generator_version()}".encode())
+    source = Path(__file__).resolve().parent / "conjugation_regularity_classifier.py"
+    digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ClassificationMemo:
+    """Memo of ``(regular, actual) -> class`` decisions stored in SQLite."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: int = MAX_ENTRIES,
+        version: Optional[str] = None,
+        entries: Optional[Dict[Tuple[str, str], str]] = None,
+    ) -> None:
+        """Load the entries of ``version`` from ``db_path``.
+
+        ``entries`` preloads the memo instead, without reading the file, as
+        the worker processes of :meth:`classify_batch` do.
+        """
+        self.db_path = Path(MEMO_PATH if db_path is None else db_path)
+        self.max_entries = max_entries
+        self.version = version or memo_version()
+        self.hits = 0
+        self.misses = 0
+        self.entries: Dict[Tuple[str, str], str] = {}
+        # Pairs added or used since loading, with their last-use time.
+        self._touched: Dict[Tuple[str, str], int] = {}
+
+        if entries is not None:
+            self.entries.update(entries)
+            return
+        rows = []  # no memo yet; save() creates it
+        if self.db_path.exists():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(
+                    f"SELECT regular, actual, class FROM {TABLE} WHERE version=?",
+                    (self.version,),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                pass
+            finally:
+                conn.close()
+        for regular, actual, cls in rows:
+            self.entries[regular, actual] = cls
+
+    @staticmethod
+    def _create(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                version TEXT,
+                regular TEXT,
+                actual TEXT,
+                class TEXT,
+                last_used INTEGER,
+                PRIMARY KEY (version, regular, actual)
+            )
+            """
+        )
+
+    def get(self, regular: str, actual: str) -> Optional[str]:
+        cls = self.entries.get((regular, actual))
+        if cls is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._touched[regular, actual] = time.time_ns()
+        return cls
+
+    def put(self, regular: str, actual: str, cls: str) -> None:
+        self.entries[regular, actual] = cls
+        self._touched[regular, actual] = time.time_ns()
+
+    def drain(self) -> Tuple[Dict[Tuple[str, str], str], int, int]:
+        """Return and reset the entries used or added, hits and misses."""
+        touched = {pair: self.entries[pair] for pair in self._touched}
+        drained = (touched, self.hits, self.misses)
+        self._touched.clear()
+        self.hits = self.misses = 0
+        return drained
+
+    def merge(self, drained: Tuple[Dict[Tuple[str, str], str], int, int]) -> None:
+        """Add what another memo's :meth:`drain` returned to this memo."""
+        touched, hits, misses = drained
+        for (regular, actual), cls in touched.items():
+            self.put(regular, actual, cls)
+        self.hits += hits
+        self.misses += misses
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.entries),
+        }
+
+    def save(self) -> None:
+        """Write new and used entries, drop stale versions and trim the table."""
+        rows = [
+            (self.version, regular, actual, self.entries[regular, actual], used)
+            for (regular, actual), used in self._touched.items()
+        ]
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            self._create(conn)
+            conn.execute(f"DELETE FROM {TABLE} WHERE version != ?", (self.version,))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {TABLE} VALUES (?, ?, ?, ?, ?)", rows
+            )
+            conn.execute(
+                f"""
+                DELETE FROM {TABLE} WHERE rowid NOT IN (
+                    SELECT rowid FROM {TABLE} ORDER BY last_used DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+        self._touched.clear()
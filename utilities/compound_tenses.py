@@ -0,0 +1,194 @@
+"""Derive compound and progressive tenses on demand.
+
+Perfect tenses (``he hablado``, ``había hablado``) and progressive tenses
+(``estoy hablando``) are composed from the stored ``participio`` and
+``gerundio`` of a verb and the stored paradigm of ``haber`` or ``estar``.
+Nothing is fetched or written: the rows are read once, and forms are produced
+lazily by :meth:`CompoundTenseDeriver.iter_forms`.
+
+Reflexive verbs store no participio, so their perfect tenses reuse the
+participio of the plain verb when it is stored as well (``levantarse`` ->
+``me he levantado``) and are skipped otherwise.  The auxiliaries themselves
+get no progressive tenses (``estoy habiendo``, ``estoy estando``).
+
+A derived form takes its hypothetical regular form and regularity class
+from the participio or gerundio it is built on, when the rows carry them.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from .phonology import ACCENT_REVERSE
+from .regular_form_generator import PERSONS, REFLEXIVE_PRONOUNS
+
+# tense -> (auxiliary, form of the auxiliary, non-personal form of the verb)
+COMPOUND_TENSES = MappingProxyType(
+    {
+        "indicativo_perfecto": ("haber", "indicativo_presente", "participio"),
+        "indicativo_pluscuamperfecto": (
+            "haber",
+            "indicativo_imperfecto",
+            "participio",
+        ),
+        "indicativo_futuro_perfecto": ("haber", "indicativo_futuro", "participio"),
+        "condicional_perfecto": ("haber", "condicional", "participio"),
+        "subjuntivo_perfecto": ("haber", "subjuntivo_presente", "participio"),
+        "subjuntivo_pluscuamperfecto": (
+            "haber",
+            "subjuntivo_imperfecto",
+            "participio",
+        ),
+        "indicativo_presente_progresivo": (
+            "estar",
+            "indicativo_presente",
+            "gerundio",
+        ),
+        "indicativo_imperfecto_progresivo": (
+            "estar",
+            "indicativo_imperfecto",
+            "gerundio",
+        ),
+    }
+)
+AUXILIARIES = ("haber", "estar")
+
+# (verb, form, person, conjugation), optionally followed by
+# (hypothetical_regular_conjugation, regularity_class)
+Row = Tuple[str, ...]
+
+
+class CompoundTenseDeriver:
+    """Compose compound tenses from stored ``(verb, form, person, conjugation)`` rows."""
+
+    def __init__(self, rows: Iterable[Row]) -> None:
+        self.non_personal: Dict[str, Dict[str, str]] = {}
+        # (verb, form) -> (hypothetical regular form, regularity class)
+        self.regularity: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self.auxiliaries: Dict[Tuple[str, str, str], str] = {}
+        # Persons each verb is conjugated for, so third-person-only verbs
+        # keep their restriction in the derived tenses.
+        self.persons: Dict[str, Set[str]] = {}
+        for verb, form, person, conjugation, *regularity in rows:
+            if not conjugation:
+                continue
+            if person != "not_applicable":
+                self.persons.setdefault(verb, set()).add(person)
+            if form in ("participio", "gerundio"):
+                self.non_personal.setdefault(verb, {})[form] = conjugation
+                if regularity:
+                    self.regularity[verb, form] = tuple(regularity)
+            if verb in AUXILIARIES:
+                self.auxiliaries[verb, form, person] = conjugation
+
+    @classmethod
+    def from_db(cls, db_path: str = "cards.db") -> "CompoundTenseDeriver":
+        """Load the stored rows of ``cards.db``."""
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT verb, form, person, conjugation, "
+                "hypothetical_regular_conjugation, regularity_class FROM cards"
+            ).fetchall()
+        return cls(rows)
+
+    def verbs(self) -> Iterator[str]:
+        return iter(self.non_personal)
+
+    @staticmethod
+    def _source(verb: str, form: str) -> str:
+        """Return the verb whose stored ``form`` a derivation of ``verb`` uses."""
+        return verb[:-2] if verb.endswith("se") and form == "participio" else verb
+
+    @staticmethod
+    def _adapt(verb: str, form: str, value: Optional[str]) -> Optional[str]:
+        if value and verb.endswith("se") and form == "gerundio":
+            # "levantándose" -> "levantando"; gerunds carry no written accent.
+            return value[:-2].translate(ACCENT_REVERSE)
+        return value
+
+    def _non_personal(self, verb: str, form: str) -> Optional[str]:
+        value = self.non_personal.get(self._source(verb, form), {}).get(form)
+        return self._adapt(verb, form, value)
+
+    def _compose(self, verb: str, person: str, head: str, tail: str) -> str:
+        if verb.endswith("se"):
+            return f"{REFLEXIVE_PRONOUNS[person]} {head} {tail}"
+        return f"{head} {tail}"
+
+    def _parts(
+        self, verb: str, tense: str, person: str
+    ) -> Optional[Tuple[str, str, str]]:
+        """Return ``(auxiliary form, non-personal form, source form)``."""
+        if person not in self.persons.get(verb, ()):
+            return None
+        auxiliary, aux_form, source = COMPOUND_TENSES[tense]
+        if source == "gerundio" and verb in AUXILIARIES:
+            return None
+        head = self.auxiliaries.get((auxiliary, aux_form, person))
+        tail = self._non_personal(verb, source)
+        if not head or not tail:
+            return None
+        return head, tail, source
+
+    def derive(self, verb: str, tense: str, person: str) -> Optional[str]:
+        """Return ``verb`` in compound ``tense`` for ``person``, or ``None``.
+
+        ``None`` means a stored form needed for the derivation is missing,
+        ``verb`` is not conjugated for ``person``, or ``verb`` is an
+        auxiliary and ``tense`` is progressive.
+        """
+        parts = self._parts(verb, tense, person)
+        if parts is None:
+            return None
+        head, tail, _ = parts
+        return self._compose(verb, person, head, tail)
+
+    def regularity_of(
+        self, verb: str, tense: str, person: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the hypothetical regular form and class of a derived form.
+
+        Both come from the participio or gerundio the form is built on;
+        ``(None, None)`` when the rows did not carry them.
+        """
+        parts = self._parts(verb, tense, person)
+        if parts is None:
+            return None, None
+        head, _, source = parts
+        regular, regularity_class = self.regularity.get(
+            (self._source(verb, source), source), (None, None)
+        )
+        regular = self._adapt(verb, source, regular)
+        if regular is None:
+            return None, regularity_class
+        return self._compose(verb, person, head, regular), regularity_class
+
+    def iter_forms(
+        self,
+        verbs: Optional[Iterable[str]] = None,
+        tenses: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, str]]:
+        """Yield derived rows lazily, as dicts keyed by ``cards`` column names.
+
+        The keys are ``verb``, ``form``, ``person``, ``conjugation``,
+        ``hypothetical_regular_conjugation`` and ``regularity_class``.
+        """
+        tenses = tuple(COMPOUND_TENSES if tenses is None else tenses)
+        for verb in self.verbs() if verbs is None else verbs:
+            for tense in tenses:
+                for person in PERSONS:
+                    conjugation = self.derive(verb, tense, person)
+                    if conjugation:
+                        regular, regularity_class = self.regularity_of(
+                            verb, tense, person
+                        )
+                        yield {
+                            "verb": verb,
+                            "form": tense,
+                            "person": person,
+                            "conjugation": conjugation,
+                            "hypothetical_regular_conjugation": regular,
+                            "regularity_class": regularity_class,
+                        }
@@ -1,86 +1,373 @@
 from __future__ import annotations
 
+import itertools
+import multiprocessing
 import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple, Union
 
-from .regular_form_generator import RegularFormGenerator
+from .regular_form_generator import (
+    FORM_NAME_TO_ID,
+    PERSON_NAME_TO_ID,
+    RegularFormGenerator,
+)
+
+if TYPE_CHECKING:
+    from .classification_memo import ClassificationMemo
 
 ACCENTS = "áéíóúÁÉÍÓÚ"
 PLAIN = "aeiouAEIOU"
 ACCENT_REVERSE = str.maketrans(ACCENTS + "üÜ", PLAIN + "uU")
 
+FRONT = "eéií"
+BACK = "aoáó"
+
+
+class _SpellingRule:
+    """One orthographic rewrite, compiled once.
+
+    ``offset`` is the distance from the start of a match to the first
+    character the rewrite changes, and ``pairs`` lists the
+    ``(regular, actual)`` characters found there.
+    """
+
+    def __init__(self, name, pattern, repl, offset, pairs):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.repl = repl
+        self.offset = offset
+        self.pairs = tuple(pairs)
+
+    def sub(self, regular: str) -> str:
+        return self.pattern.sub(self.repl, regular)
+
+    def rewrites(self, regular: str, actual: str, diff: int) -> bool:
+        """Return whether the rule maps ``regular`` onto ``actual``.
+
+        ``diff`` is the first index where the two differ.  The first match
+        must sit there, so only the text from it onwards is rewritten.
+        """
+        start = diff - self.offset
+        first = self.pattern.search(regular)
+        if first is None or first.start() != start:
+            return False
+        parts = []
+        pos = start
+        for match in self.pattern.finditer(regular, start):
+            parts.append(regular[pos : match.start()])
+            parts.append(match.expand(self.repl))
+            pos = match.end()
+        parts.append(regular[pos:])
+        return "".join(parts) == actual[start:]
+
+
+# Rules in precedence order.
+ORTHOGRAPHIC_RULES = (
+    _SpellingRule("c_to_qu", rf"c([{FRONT}])", r"qu\1", 0, [("c", "q")]),
+    _SpellingRule(
+        "g_to_gu", rf"g([{FRONT}])", r"gu\1", 1, [(v, "u") for v in FRONT]
+    ),
+    _SpellingRule("z_to_c", rf"z([{FRONT}])", r"c\1", 0, [("z", "c")]),
+    _SpellingRule("g_to_j", rf"g([{BACK}])", r"j\1", 0, [("g", "j")]),
+    _SpellingRule(
+        "gu_to_gue_dieresis", rf"gu([{FRONT}])", r"gü\1", 1, [("u", "ü")]
+    ),
+    _SpellingRule(
+        "guir_drop_u", rf"gu([{BACK}])", r"g\1", 1, [("u", v) for v in BACK]
+    ),
+    _SpellingRule(
+        "c_to_z_after_consonant",
+        r"(?<=[^aeiouáéíóúü])c([oaóá])",
+        r"z\1",
+        0,
+        [("c", "z")],
+    ),
+    _SpellingRule("i_to_y", r"i([aeoáéó])", r"y\1", 0, [("i", "y")]),
+)
+_RULES_BY_PAIR: dict[tuple[str, str], list[_SpellingRule]] = {}
+for _rule in ORTHOGRAPHIC_RULES:
+    for _pair in _rule.pairs:
+        _RULES_BY_PAIR.setdefault(_pair, []).append(_rule)
+del _rule, _pair
+
+
+# One normalisation per family of spellings that sound alike in a verb
+# stem: c/qu/z, g/gu/gü/j and i/y.  A form's key is the form under each
+# normalisation plus its accent-free spelling.
+_KEY_RULES = (
+    (
+        re.compile(
+            r"qu(?=[eéií])|z(?=[eéií])"
+            r"|(?<=[^aeiouáéíóúü])z(?=[oaóá])"
+        ),
+        "c",
+    ),
+    (re.compile(r"g[uü](?=[eéií])|gu(?=[aoáó])|j(?=[aoáó])"), "g"),
+    (re.compile(r"i(?=[aeoáéó])"), "y"),
+)
+KEY_CACHE_SIZE = 16384
+
+# Rows sent to a worker at a time by ``classify_batch``.
+BATCH_CHUNK_SIZE = 2048
+
+BatchRow = Tuple[str, Union[str, int], Union[str, int], str]
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def phonetic_key(form: str) -> tuple[str, ...]:
+    """Return the canonical spellings of ``form``, one per spelling family.
+
+    Two forms are orthographic variants when they differ and agree on at
+    least one component, i.e. a single family of spelling changes (or the
+    written accents alone) accounts for the difference.
+    """
+    return tuple(pattern.sub(repl, form) for pattern, repl in _KEY_RULES) + (
+        form.translate(ACCENT_REVERSE),
+    )
+
 
 class ConjugationRegularityClassifier:
-    """Classify how a verb deviates from regular conjugation."""
+    """Classify how a verb deviates from regular conjugation.
+
+    ``memo`` is an optional :class:`ClassificationMemo` consulted before the
+    phonetic keys are compared for a pair of differing forms.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, memo: ClassificationMemo | None = None) -> None:
         self.generator = RegularFormGenerator()
+        self.memo = memo
 
     def _strip_accents(self, text: str) -> str:
         return text.translate(ACCENT_REVERSE)
 
-    def _c_to_qu(self, regular: str) -> str:
-        return re.sub(r"c([eéií])", r"qu\1", regular)
+    def orthographic_rule(self, regular: str, actual: str) -> str | None:
+        """Return the name of the spelling rule turning ``regular`` into ``actual``.
 
-    def _g_to_gu(self, regular: str) -> str:
-        return re.sub(r"g([eéií])", r"gu\1", regular)
+        The strings are compared once; only the rules whose rewrite can
+        produce the first differing character pair are tried, starting at
+        that position.  Returns ``"accent_shift"`` when the forms differ only
+        in written accents, and ``None`` when no rule applies.
+        """
+        if regular == actual:
+            return None
+        i = 0
+        limit = min(len(regular), len(actual))
+        while i < limit and regular[i] == actual[i]:
+            i += 1
+        if i == limit:
+            return None
 
-    def _z_to_c(self, regular: str) -> str:
-        return re.sub(r"z([eéií])", r"c\1", regular)
+        pair = (regular[i], actual[i])
+        for rule in _RULES_BY_PAIR.get(pair, ()):
+            if rule.rewrites(regular, actual, i):
+                return rule.name
+        if pair[0].translate(ACCENT_REVERSE) == pair[1].translate(ACCENT_REVERSE):
+            if regular[i:].translate(ACCENT_REVERSE) == actual[i:].translate(
+                ACCENT_REVERSE
+            ):
+                return "accent_shift"
+        return None
 
-    def _g_to_j(self, regular: str) -> str:
-        return re.sub(r"g([aoáó])", r"j\1", regular)
+    def is_orthographic_variant(self, regular: str, actual: str) -> bool:
+        if regular == actual:
+            return True
+        return self.orthographic_rule(regular, actual) is not None
 
-    def _gu_to_gue_dieresis(self, regular: str) -> str:
-        return re.sub(r"gu([eéií])", r"gü\1", regular)
+    def _classify_cell(self, regular: str, actual: str) -> str:
+        if regular == actual:
+            return "regular"
+        memo = self.memo
+        if memo is not None:
+            cls = memo.get(regular, actual)
+            if cls is None:
+                cls = self._compare_keys(regular, actual)
+                memo.put(regular, actual, cls)
+            return cls
+        return self._compare_keys(regular, actual)
 
-    def _guir_drop_u(self, regular: str) -> str:
-        return re.sub(r"gu([aoáó])", r"g\1", regular)
+    @staticmethod
+    def _compare_keys(regular: str, actual: str) -> str:
+        for a, b in zip(phonetic_key(regular), phonetic_key(actual)):
+            if a == b:
+                return "orthographically_irregular"
+        return "morphologically_irregular"
 
-    def _c_to_z_after_consonant(self, regular: str) -> str:
-        return re.sub(r"(?<=[^aeiouáéíóúü])c([oaóá])", r"z\1", regular)
+    def classify_id(
+        self,
+        verb: str,
+        form_id: int,
+        person_id: int,
+        actual: str,
+        grid: list[list[str]] | None = None,
+    ) -> str:
+        """Return the regularity class of one cell addressed by integer ids.
 
-    def _i_to_y(self, regular: str) -> str:
-        return re.sub(r"i([aeoáéó])", r"y\1", regular)
+        ``grid`` may be the verb's precomputed
+        :meth:`RegularFormGenerator.generate_paradigm_ids` grid; otherwise the
+        regular form is generated on demand.
+        """
+        if grid is None:
+            regular = self.generator.generate_id(verb, form_id, person_id)
+        else:
+            regular = grid[form_id][person_id]
+        return self._classify_cell(regular, actual)
 
-    def _accent_shift(self, regular: str) -> str:
-        return regular  # accents handled separately
+    def classify(
+        self,
+        verb: str,
+        conjugations: dict[str, dict[str, str]],
+        paradigm: dict[str, dict[str, str]] | None = None,
+    ) -> str:
+        """Return the regularity class of ``conjugations`` for ``verb``.
 
-    def is_orthographic_variant(self, regular: str, actual: str) -> bool:
-        # Check transformations in order
-        candidates = [
-            self._c_to_qu,
-            self._g_to_gu,
-            self._z_to_c,
-            self._g_to_j,
-            self._gu_to_gue_dieresis,
-            self._guir_drop_u,
-            self._c_to_z_after_consonant,
-            self._i_to_y,
-        ]
-        for func in candidates:
-            if func(regular) == actual:
-                return True
-        # Accent shift only
-        if (
-            self._strip_accents(regular) == self._strip_accents(actual)
-            and regular != actual
-        ):
-            return True
-        return False
-
-    def classify(self, verb: str, conjugations: dict[str, dict[str, str]]) -> str:
-        results = []
+        ``paradigm`` may be the verb's precomputed
+        :meth:`RegularFormGenerator.generate_paradigm` grid; otherwise each
+        regular form is generated on demand.
+        """
+        results = set()
         for form, persons in conjugations.items():
             for person, actual in persons.items():
-                regular = self.generator.generate(verb, form, person)
-                if regular == actual:
-                    continue
-                if self.is_orthographic_variant(regular, actual):
-                    results.append("orthographic")
+                if paradigm is None:
+                    regular = self.generator.generate(verb, form, person)
                 else:
-                    results.append("morphological")
-        if any(r == "morphological" for r in results):
+                    regular = paradigm.get(form, {}).get(person, "")
+                results.add(self._classify_cell(regular, actual))
+        return self._summarize(results)
+
+    def classify_paradigm(
+        self,
+        verb: str,
+        paradigm: dict[str, dict[str, str] | str],
+        grid: list[list[str]] | None = None,
+    ) -> tuple[dict[str, dict[str, str]], str]:
+        """Classify every cell of a transformed RAE ``paradigm`` of ``verb``.
+
+        ``paradigm`` is shaped like :meth:`RAEConjugationTransformer.transform`
+        output, with the non-personal forms as plain strings.  The regular
+        grid is generated once, or taken from ``grid`` when the caller already
+        has it.
+
+        Returns ``(classes, summary)`` where ``classes`` is
+        ``{form: {person: class}}`` (non-personal forms under
+        ``"not_applicable"``) and ``summary`` is the verb-level class that
+        :meth:`classify` would report.
+        """
+        if grid is None:
+            grid = self.generator.generate_paradigm_ids(verb)
+        classes: dict[str, dict[str, str]] = {}
+        seen = set()
+        for form, persons in paradigm.items():
+            if not isinstance(persons, dict):
+                persons = {"not_applicable": persons}
+            form_id = FORM_NAME_TO_ID.get(form)
+            row = grid[form_id] if form_id is not None else None
+            cells = classes[form] = {}
+            for person, actual in persons.items():
+                person_id = PERSON_NAME_TO_ID.get(person)
+                if row is None or person_id is None:
+                    regular = ""
+                else:
+                    regular = row[person_id]
+                cells[person] = cell = self._classify_cell(regular, actual)
+                seen.add(cell)
+        return classes, self._summarize(seen)
+
+    @staticmethod
+    def _summarize(results: set[str]) -> str:
+        if "morphologically_irregular" in results:
             return "morphologically_irregular"
-        if any(r == "orthographic" for r in results):
+        if "orthographically_irregular" in results:
             return "orthographically_irregular"
         return "regular"
+
+    def classify_batch(
+        self,
+        rows: Iterable[BatchRow],
+        workers: int | None = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Yield the class of each ``(verb, form, person, actual)`` row in order.
+
+        ``form`` and ``person`` may be names or integer ids.  Rows are cut
+        into chunks of about ``chunk_size`` rows, ending each chunk at a
+        change of verb so that one worker generates each verb's regular grid
+        once.  Chunks are classified in a pool of ``workers`` processes
+        (default: one per CPU), each keeping its own classifier, and results
+        are streamed back in input order.  ``workers=1`` classifies in this
+        process.
+
+        Each worker starts from a copy of :attr:`memo`; the entries it uses
+        or adds and its hits and misses are merged back into :attr:`memo`
+        with each chunk's results.
+        """
+        chunks = _verb_chunks(rows, chunk_size)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if workers <= 1:
+            for chunk in chunks:
+                yield from self._classify_chunk(chunk)
+            return
+        memo = self.memo
+        memo_state = None if memo is None else (memo.version, memo.entries)
+        with multiprocessing.Pool(
+            workers, initializer=_init_batch_worker, initargs=(memo_state,)
+        ) as pool:
+            for classes, drained in pool.imap(_classify_batch_chunk, chunks):
+                if drained is not None:
+                    memo.merge(drained)
+                yield from classes
+
+    def _classify_chunk(self, chunk: list[BatchRow]) -> list[str]:
+        grids: dict[str, list[list[str]]] = {}
+        classes = []
+        for verb, form, person, actual in chunk:
+            grid = grids.get(verb)
+            if grid is None:
+                grid = grids[verb] = self.generator.generate_paradigm_ids(verb)
+            form_id = FORM_NAME_TO_ID.get(form, form)
+            person_id = PERSON_NAME_TO_ID.get(person, person)
+            if (
+                not isinstance(form_id, int)
+                or not isinstance(person_id, int)
+                or not 0 <= form_id < len(grid)
+                or not 0 <= person_id < len(grid[form_id])
+            ):
+                regular = ""
+            else:
+                regular = grid[form_id][person_id]
+            classes.append(self._classify_cell(regular, actual))
+        return classes
+
+
+def _verb_chunks(
+    rows: Iterable[BatchRow], chunk_size: int
+) -> Iterator[list[BatchRow]]:
+    """Group ``rows`` into lists of at least ``chunk_size`` rows split by verb."""
+    chunk: list[BatchRow] = []
+    for verb, group in itertools.groupby(rows, key=lambda row: row[0]):
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+        chunk.extend(group)
+    if chunk:
+        yield chunk
+
+
+_worker_classifier: ConjugationRegularityClassifier | None = None
+
+
+def _init_batch_worker(memo_state: tuple[str, dict] | None) -> None:
+    global _worker_classifier
+    memo = None
+    if memo_state is not None:
+        from .classification_memo import ClassificationMemo
+
+        version, entries = memo_state
+        memo = ClassificationMemo(version=version, entries=entries)
+    _worker_classifier = ConjugationRegularityClassifier(memo=memo)
+
+
+def _classify_batch_chunk(chunk: list[BatchRow]) -> tuple[list[str], tuple | None]:
+    classes = _worker_classifier._classify_chunk(chunk)
+    memo = _worker_classifier.memo
+    return classes, None if memo is None else memo.drain()
@@ -2,12 +2,26 @@
 
 This script scrapes the conjugation tables from ``dle.rae.es``.  The
 site sits behind Cloudflare so ``cloudscraper`` is used to emulate a
-real browser.  Parsed results are transformed into the deck's JSON
-format and printed to stdout.
+real browser.  Fetched pages are kept in a compressed on-disk cache
+(see :mod:`utilities.html_cache`), so repeated runs do not hit the network;
+``--offline`` never fetches.  Network requests go through a per-host token
+bucket (see :mod:`utilities.rate_limit`), so several verbs can be fetched
+concurrently with :meth:`RAEConjugationFetcher.get_conjugations` without
+exceeding the politeness budget.  Parsed results are transformed into the
+deck's JSON format and printed to stdout.
+
+Several verbs, given as arguments, with ``--file`` or on stdin, are
+fetched over one session and written as NDJSON, one line per verb::
+
+    {"verb": "amar", "conjugations": {...}}
+    {"verb": "xyz", "error": "HTTPError: 404 ..."}
 
 Example::
 
-    python get_conjugation_rae.py amar
+    python -m utilities.get_conjugation_rae amar
+    python -m utilities.get_conjugation_rae --offline amar
+    python -m utilities.get_conjugation_rae amar comer vivir
+    python -m utilities.get_conjugation_rae -f verbs.txt > conjugations.ndjson
 
 """
 
@@ -16,18 +30,87 @@ from __future__ import annotations
 import argparse
 import json
 import re
-from typing import Dict, Iterable, Tuple
-
-import pyphen
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Tuple
+
+from . import phonology
+from .html_cache import HTMLCache, OfflineCacheMiss, env_offline, page_digest
+from .rate_limit import HostRateLimiter
+from .retry import (
+    CircuitBreaker,
+    CircuitOpen,
+    FetchStats,
+    RetryPolicy,
+    is_transient,
+)
 
 
 REFLEXIVE_SUFFIXES = ["se", "me", "te", "nos", "os"]
 
-ACCENTS = "áéíóú"
-PLAIN = "aeiou"
-ACCENT_MAP = dict(zip(PLAIN, ACCENTS))
-ACCENT_REVERSE = str.maketrans(ACCENTS, PLAIN)
-_dic = pyphen.Pyphen(lang="es")
+# Politeness budget for dle.rae.es: requests per second and burst size.
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 2
+DEFAULT_WORKERS = 4
+
+# Version of the raw tables returned by ``_parse_conjugation``; bump it when
+# their content changes so stored parses (see :mod:`utilities.raw_store`)
+# are fetched again.
+PARSER_VERSION = 1
+
+# Irregular affirmative imperatives of ``irse`` and ``darse``.
+ENCLITIC_EXCEPTIONS = {
+    ("vayamos", "nos"): "vámonos",
+    ("id", "os"): "idos",
+    ("dé", "se"): "dese",
+}
+
+
+# Markup tokens that can hold tags or ">": comments, <script>/<style> bodies
+# (skipped like the parser does) and tags, whose attribute values may be
+# quoted.
+_ATTRS = r"""((?:[^>"']|"[^"]*"|'[^']*')*)"""
+_TOKEN = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    rf"|<(script|style)\b{_ATTRS}>.*?(?:</\1\s*>|\Z)"
+    rf"|<(/?)([a-zA-Z][\w:-]*){_ATTRS}>",
+    re.DOTALL | re.IGNORECASE,
+)
+# An id attribute starting with "conjugacion".
+_SECTION_ID = re.compile(r"""(?:^|\s)(?i:id)\s*=\s*["']?conjugacion""")
+
+
+def conjugation_section(html: str) -> str | None:
+    """Return the markup of the conjugation section of ``html``.
+
+    The element is cut out of the page by matching its opening and closing
+    tags, so only the section needs to be parsed.  Returns ``None`` when the
+    page has no conjugation section.
+    """
+    start = name = None
+    depth = 0
+    for match in _TOKEN.finditer(html):
+        closing, tag, attrs = match.group(3, 4, 5)
+        if tag is None:
+            continue  # comment, script or style
+        tag = tag.lower()
+        if start is None:
+            if closing or not _SECTION_ID.search(attrs):
+                continue
+            start, name = match.start(), tag
+        if tag != name:
+            continue
+        if closing:
+            depth -= 1
+            if depth == 0:
+                return html[start : match.end()]
+        elif not attrs.rstrip().endswith("/"):
+            depth += 1
+        elif depth == 0:
+            return html[start : match.end()]  # self-closing section
+    return None if start is None else html[start:]
 
 
 def strip_reflexive(verb: str) -> Tuple[str, bool]:
@@ -38,26 +121,139 @@ def strip_reflexive(verb: str) -> Tuple[str, bool]:
     return verb, False
 
 
-import cloudscraper
-from bs4 import BeautifulSoup
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from bs4 import BeautifulSoup
 
 
 class RAEConjugationFetcher:
-    """Fetch and parse Spanish verb conjugations from the RAE website."""
+    """Fetch and parse Spanish verb conjugations from the RAE website.
+
+    Pages are kept in an :class:`HTMLCache` (pass ``cache=False`` to disable
+    it).  With ``offline=True`` (or ``RAE_OFFLINE=1``) only cached pages are
+    used and a missing page raises :class:`OfflineCacheMiss`.  Network
+    requests are limited to ``rate`` per second per host, with bursts of up
+    to ``burst``; cache hits are not limited.  Transient failures are
+    retried following ``retry`` and counted in :attr:`stats`; repeated ones
+    open ``breaker``, pausing every worker, and make fetches fail fast if
+    the host stays down (see :mod:`utilities.retry`).
+    """
 
     BASE_URL = "https://dle.rae.es"
 
-    def __init__(self) -> None:
-        self.scraper = cloudscraper.create_scraper(
-            browser={"browser": "firefox", "platform": "windows", "desktop": True},
-            delay=1.0,  # polite throttle
-        )
+    def __init__(
+        self,
+        cache: HTMLCache | bool | None = None,
+        offline: bool | None = None,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        if cache is None or cache is True:
+            cache = HTMLCache()
+        self.cache = cache or None
+        self.offline = env_offline() if offline is None else offline
+        self.limiter = HostRateLimiter(rate, burst)
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = FetchStats()
+        # When each verb's page was downloaded, and its SHA-256.
+        self.fetched_at: Dict[str, float] = {}
+        self.page_sha256: Dict[str, str] = {}
+        # Tables parsed earlier, as {verb: (page_sha256, raw)}; a page with
+        # the same digest is not parsed again.
+        self.known_parses: Dict[str, Tuple[str | None, dict]] = {}
+        self._local = threading.local()
+
+    @property
+    def scraper(self):
+        """This thread's ``cloudscraper`` session, created on first use."""
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            # The scraping stack is slow to import; only load it for fetching.
+            import cloudscraper
+
+            scraper = self._local.scraper = cloudscraper.create_scraper(
+                browser={"browser": "firefox", "platform": "windows", "desktop": True},
+                delay=1.0,
+            )
+        return scraper
 
     def fetch_html(self, verb: str) -> str:
-        """Return the HTML for the RAE page of ``verb``."""
-        resp = self.scraper.get(f"{self.BASE_URL}/{verb}", timeout=10)
-        resp.raise_for_status()
-        return resp.text
+        """Return the HTML for the RAE page of ``verb``.
+
+        An expired cached page is revalidated with a conditional request and
+        kept when the server answers ``304 Not Modified``.
+        """
+        url = f"{self.BASE_URL}/{verb}"
+        record = None
+        if self.cache is not None:
+            record = self.cache.load(verb, url)
+            if record is not None and (self.offline or self.cache.is_fresh(record)):
+                return self._use(verb, record)
+        if self.offline:
+            raise OfflineCacheMiss(f"{url} is not cached")
+
+        headers = {}
+        if record is not None:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        resp = self._download(url, headers)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if resp.status_code == 304 and record is not None:
+            self.stats.record_not_modified()
+            html = record["html"]
+            etag = etag or record.get("etag")
+            last_modified = last_modified or record.get("last_modified")
+        else:
+            html = resp.text
+        if self.cache is not None:
+            record = self.cache.put(verb, url, html, etag, last_modified)
+            return self._use(verb, record)
+        self.fetched_at[verb] = time.time()
+        self.page_sha256[verb] = page_digest(html)
+        return html
+
+    def _use(self, verb: str, record: dict) -> str:
+        self.fetched_at[verb] = record["fetched_at"]
+        self.page_sha256[verb] = record.get("sha256") or page_digest(record["html"])
+        return record["html"]
+
+    def _download(self, url: str, headers: Dict[str, str] | None = None):
+        """GET ``url``, retrying transient failures with jittered backoff."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.wait()
+            except CircuitOpen:
+                self.stats.record_failure()
+                raise
+            self.limiter.acquire(url)
+            start = time.perf_counter()
+            try:
+                resp = self.scraper.get(url, headers=headers, timeout=10)
+                resp.raise_for_status()
+            except Exception as exc:
+                self.stats.record_request(time.perf_counter() - start)
+                transient = is_transient(exc)
+                if transient:
+                    self.breaker.record_failure()
+                    self._local.scraper = None  # start a fresh session
+                else:
+                    self.breaker.record_success()  # the host did answer
+                if not transient or attempt >= self.retry.attempts:
+                    self.stats.record_failure()
+                    raise
+                self.stats.record_retry()
+                self.retry.sleep(self.retry.delay(attempt))
+                continue
+            self.stats.record_request(time.perf_counter() - start)
+            self.breaker.record_success()
+            return resp
 
     def _parse_non_personal(self, table: BeautifulSoup) -> Dict[str, str]:
         """Parse tables without pronouns (infinitive, gerund, participle)."""
@@ -100,9 +296,21 @@ class RAEConjugationFetcher:
                 result.setdefault(tense, {})[pronoun] = form
         return result
 
-    def _parse_conjugation(self, html: str) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Return a nested dict containing all conjugations found in ``html``."""
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_conjugation(
+        self, html: str, full_page: bool = False
+    ) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Return a nested dict containing all conjugations found in ``html``.
+
+        Only the conjugation section is parsed; ``full_page=True`` builds a
+        tree of the whole page instead, as a reference for tests and
+        benchmarks.
+        """
+        from bs4 import BeautifulSoup
+
+        markup = html if full_page else conjugation_section(html)
+        if markup is None:
+            return {}
+        soup = BeautifulSoup(markup, "html.parser")
         section = soup.find(id=lambda x: x and x.startswith("conjugacion"))
         if not section:
             return {}
@@ -131,8 +339,41 @@ class RAEConjugationFetcher:
     def get_conjugation(self, verb: str) -> Dict[str, Dict[str, Dict[str, str]]]:
         """Fetch and parse the RAE conjugation table for ``verb``."""
         html = self.fetch_html(verb)
+        digest, raw = self.known_parses.get(verb, (None, None))
+        if digest is not None and digest == self.page_sha256.get(verb):
+            self.stats.record_unchanged()
+            return raw
         return self._parse_conjugation(html)
 
+    def get_conjugations(
+        self,
+        verbs: Iterable[str],
+        workers: int = DEFAULT_WORKERS,
+        return_exceptions: bool = False,
+    ) -> Iterator[Dict[str, Dict[str, Dict[str, str]]] | Exception]:
+        """Fetch and parse ``verbs`` with ``workers`` threads.
+
+        Results are yielded in the order of ``verbs``.  An exception raised
+        for a verb is re-raised when its result is reached, or yielded in
+        its place with ``return_exceptions=True``.
+        """
+        verbs = list(verbs)
+        get = self._get_or_exception if return_exceptions else self.get_conjugation
+        if workers <= 1 or len(verbs) <= 1:
+            for verb in verbs:
+                yield get(verb)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(get, verbs)
+
+    def _get_or_exception(
+        self, verb: str
+    ) -> Dict[str, Dict[str, Dict[str, str]]] | Exception:
+        try:
+            return self.get_conjugation(verb)
+        except Exception as exc:
+            return exc
+
 
 class RAEConjugationTransformer:
     """Convert raw RAE tables into the project's conjugation format."""
@@ -174,53 +415,6 @@ class RAEConjugationTransformer:
                 text = text.split(sep)[0]
         return text.strip()
 
-    def _syllables(self, word: str) -> list[str]:
-        syls = _dic.inserted(word).split("-")
-        result: list[str] = []
-        for syl in syls:
-            parts = re.split(
-                r"(?<=[aeiouáéíóúü])(?=[^aeiouáéíóúü]+[aeiouáéíóúü])",
-                syl,
-                flags=re.IGNORECASE,
-            )
-            result.extend([p for p in parts if p])
-        return result
-
-    def _stress_index(self, word: str) -> int:
-        syls = self._syllables(word)
-        for i, s in enumerate(syls):
-            if any(c in ACCENTS for c in s):
-                return i
-        if word[-1].lower() in ("n", "s") or word[-1].lower() in PLAIN:
-            return max(len(syls) - 2, 0)
-        return len(syls) - 1
-
-    def _apply_accent(self, word: str, index: int) -> str:
-        syls = self._syllables(word)
-        if index < 0 or index >= len(syls):
-            return word
-        s = syls[index]
-        if any(c in ACCENTS for c in s):
-            syls[index] = s
-        else:
-            pos = -1
-            for j in range(len(s) - 1, -1, -1):
-                ch = s[j].lower()
-                if ch in "aeo":
-                    pos = j
-                    break
-            if pos == -1:
-                for j in range(len(s) - 1, -1, -1):
-                    if s[j].lower() in "iu":
-                        pos = j
-                        break
-            if pos != -1:
-                ch = s[pos]
-                accent = ACCENT_MAP.get(ch.lower(), ch)
-                s = s[:pos] + accent + s[pos + 1 :]
-            syls[index] = s
-        return "".join(syls)
-
     def _map_personal(self, mapping: Dict[str, str]) -> Dict[str, str]:
         result: Dict[str, str] = {}
         for pronoun, value in mapping.items():
@@ -286,35 +480,6 @@ class RAEConjugationTransformer:
             base = base[:-2]
         ending = base[-2:]
 
-        def attach_affirmative(form: str, pron: str) -> str:
-            original = form
-            if base == "dar" and original == "dé" and pron == "se":
-                return "dese"
-            if pron == "nos" and form.endswith("mos"):
-                if base == "ir" and original == "vayamos":
-                    return "vámonos"
-                form = form[:-1]
-                result = form + pron
-            elif pron == "os" and form.endswith("d"):
-                trimmed = form[:-1]
-                if base == "ir" and original == "id":
-                    return "idos"
-                if ending == "ir" and trimmed.endswith("i"):
-                    trimmed = trimmed[:-1] + "í"
-                result = trimmed + pron
-                return result
-            else:
-                result = form + pron
-
-            if any(c in ACCENTS for c in original):
-                return result
-
-            orig_idx = self._stress_index(original)
-            new_default = self._stress_index(result.translate(ACCENT_REVERSE))
-            if orig_idx != new_default:
-                result = self._apply_accent(result, orig_idx)
-            return result
-
         if "infinitivo" in out:
             out["infinitivo"] = f"{base}se"
         if "gerundio" in out:
@@ -339,7 +504,9 @@ class RAEConjugationTransformer:
                     continue
                 form = mapping[person]
                 if key == "imperativo_afirmativo":
-                    mapping[person] = attach_affirmative(form, pron)
+                    mapping[person] = phonology.attach_enclitics(
+                        form, pron, ending=ending, exceptions=ENCLITIC_EXCEPTIONS
+                    )
                 elif key == "imperativo_negativo":
                     if form.startswith("no "):
                         form = form[3:]
@@ -403,18 +570,96 @@ class RAEConjugationTransformer:
         return out
 
 
-def main(argv: Iterable[str] | None = None) -> None:
-    parser = argparse.ArgumentParser(description="Scrape conjugations from RAE")
-    parser.add_argument("verb", help="Spanish verb to fetch")
+def read_verbs(lines: Iterable[str]) -> list[str]:
+    """Return the verbs listed in ``lines``, skipping blanks and ``#`` comments."""
+    verbs = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            verbs.append(line)
+    return verbs
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Scrape conjugations from RAE",
+        epilog="With several verbs, or --ndjson, one JSON object per verb is "
+        "written per line as soon as it is ready.",
+    )
+    parser.add_argument(
+        "verbs",
+        nargs="*",
+        metavar="verb",
+        help="Spanish verbs to fetch (read from stdin when none are given)",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=argparse.FileType("r", encoding="utf-8"),
+        help="Read verbs from a file, one per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--ndjson", action="store_true", help="Write NDJSON even for one verb"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached pages"
+    )
+    parser.add_argument(
+        "--ttl", type=float, help="Cache time to live in seconds (0: never expire)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the cache")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help="Maximum requests per second to dle.rae.es",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Pages fetched concurrently",
+    )
     args = parser.parse_args(argv)
 
-    fetcher = RAEConjugationFetcher()
-    base, is_reflexive = strip_reflexive(args.verb)
-    raw = fetcher.get_conjugation(base)
-    transformer = RAEConjugationTransformer(args.verb, is_reflexive=is_reflexive)
-    conjugations = transformer.transform(raw)
-    print(json.dumps(conjugations, ensure_ascii=False, indent=2))
+    verbs = list(args.verbs)
+    if args.file:
+        with args.file:
+            verbs += read_verbs(args.file)
+    elif not verbs:
+        verbs = read_verbs(sys.stdin)
+    if not verbs:
+        parser.error("no verbs given")
+
+    # One fetcher, so every verb shares the session, cache and rate limit.
+    cache = False if args.no_cache else HTMLCache(ttl=args.ttl)
+    fetcher = RAEConjugationFetcher(
+        cache=cache, offline=args.offline or None, rate=args.rate
+    )
+    stripped = [strip_reflexive(verb) for verb in verbs]
+
+    if len(verbs) == 1 and not args.ndjson:
+        base, is_reflexive = stripped[0]
+        raw = fetcher.get_conjugation(base)
+        transformer = RAEConjugationTransformer(verbs[0], is_reflexive=is_reflexive)
+        conjugations = transformer.transform(raw)
+        print(json.dumps(conjugations, ensure_ascii=False, indent=2))
+        return 0
+
+    failures = 0
+    raws = fetcher.get_conjugations(
+        [base for base, _ in stripped], workers=args.workers, return_exceptions=True
+    )
+    for verb, (_, is_reflexive), raw in zip(verbs, stripped, raws):
+        if isinstance(raw, Exception):
+            failures += 1
+            record = {"verb": verb, "error": f"{type(raw).__name__}: {raw}"}
+        else:
+            transformer = RAEConjugationTransformer(verb, is_reflexive=is_reflexive)
+            record = {"verb": verb, "conjugations": transformer.transform(raw)}
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":  # pragma: no cover - simple CLI
-    main()
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Compressed on-disk cache of fetched HTML pages.
+
+Each entry is a gzip-compressed JSON record holding the verb, the URL, the
+fetch time, the page, its SHA-256 and the server's validators (``ETag``,
+``Last-Modified``), stored under a file name derived from the verb and a
+hash of the URL.  Entries older than ``ttl`` seconds are expired (see
+:meth:`HTMLCache.is_fresh`); the fetcher serves them only in offline mode,
+and otherwise revalidates them with a conditional request using their
+validators.
+
+The defaults can be set from the environment:
+
+* ``RAE_CACHE_DIR`` – cache directory (default ``build/rae_cache``);
+* ``RAE_CACHE_TTL`` – time to live in seconds (default 30 days, ``0``
+  disables expiry);
+* ``RAE_OFFLINE`` – ``1`` to serve only cached pages and never fetch.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT / "build" / "rae_cache"
+DEFAULT_TTL = 30 * 24 * 3600
+
+
+class OfflineCacheMiss(LookupError):
+    """Raised in offline mode when a page is not in the cache."""
+
+
+def page_digest(html: str) -> str:
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+def env_offline() -> bool:
+    return os.environ.get("RAE_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+class HTMLCache:
+    """Store fetched pages on disk, keyed by verb and URL."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if directory is None:
+            directory = Path(os.environ.get("RAE_CACHE_DIR", CACHE_DIR))
+        if ttl is None:
+            ttl = float(os.environ.get("RAE_CACHE_TTL", DEFAULT_TTL))
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def path(self, verb: str, url: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.directory / f"{quote(verb, safe='')}-{digest}.json.gz"
+
+    def load(self, verb: str, url: str) -> Optional[dict]:
+        """Return the stored record for ``url`` or ``None``."""
+        try:
+            with gzip.open(self.path(verb, url), "rt", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, EOFError, ValueError):
+            return None
+        return record if record.get("url") == url else None
+
+    def is_fresh(self, record: dict) -> bool:
+        """Return whether ``record`` is younger than ``ttl`` seconds."""
+        return not self.ttl or time.time() - record["fetched_at"] <= self.ttl
+
+    def put(
+        self,
+        verb: str,
+        url: str,
+        html: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> dict:
+        """Store ``html`` atomically and return the new record."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = {
+            "verb": verb,
+            "url": url,
+            "fetched_at": time.time(),
+            "html": html,
+            "sha256": page_digest(html),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp, self.path(verb, url))
+        return record
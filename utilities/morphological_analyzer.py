@@ -0,0 +1,209 @@
+"""Analyse Spanish verb forms back into (verb, form, person) candidates.
+
+Two indexes are built once:
+
+* a suffix index over the :class:`RegularFormGenerator` ending tables, so a
+  regular form is analysed by probing each of its suffixes and checking the
+  implied infinitive against the known verbs;
+* an exact index of every conjugation stored in ``cards.db``, which covers
+  irregular, orthographically adjusted and reflexive forms.
+
+Affirmative imperatives, gerunds and infinitives with attached pronouns
+(``levántate``, ``vámonos``, ``dámelo``) are analysed by stripping up to two
+enclitics and restoring the letters they displace.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .phonology import ACCENT_REVERSE
+from .regular_form_generator import (
+    INFINITIVE_ENDINGS,
+    NON_PERSONAL_FORMS,
+    STEM_ENDINGS,
+)
+
+Analysis = Tuple[str, str, str]
+
+ENCLITICS = ("nos", "os", "me", "te", "se", "los", "las", "les", "lo", "la", "le")
+ENCLITIC_FORMS = {"imperativo_afirmativo", "gerundio", "infinitivo"}
+
+# Persons a reflexive pronoun agrees with, used for "me levanto" or
+# "levántate" style forms of a ``-se`` verb.
+REFLEXIVE_PERSONS = {
+    "me": {"1st_singular"},
+    "te": {"2nd_singular"},
+    "se": {"3rd_singular", "3rd_plural", "not_applicable"},
+    "nos": {"1st_plural"},
+    "os": {"2nd_plural"},
+}
+
+_INFINITIVE_ENDINGS = {"ar": ("ar",), "er": ("er",), "ir": ("ir", "ír")}
+_NON_PERSONAL_SUFFIXES = {
+    "infinitivo": {"ar": "ar", "er": "er", "ir": "ir"},
+    "gerundio": {"ar": "ando", "er": "iendo", "ir": "iendo"},
+    "participio": {"ar": "ado", "er": "ido", "ir": "ido"},
+}
+
+
+def _build_suffix_index() -> Dict[str, List[Tuple[str, str, str, bool]]]:
+    """Map each regular suffix to ``(ending, form, person, on_infinitive)``."""
+    index: Dict[str, List[Tuple[str, str, str, bool]]] = {}
+    for form in NON_PERSONAL_FORMS:
+        for ending, suffix in _NON_PERSONAL_SUFFIXES[form].items():
+            index.setdefault(suffix, []).append(
+                (ending, form, "not_applicable", False)
+            )
+    for (form, ending, person), suffix in STEM_ENDINGS.items():
+        index.setdefault(suffix, []).append((ending, form, person, False))
+    for (form, person), suffix in INFINITIVE_ENDINGS.items():
+        index.setdefault(suffix, []).append(("", form, person, True))
+    return index
+
+
+SUFFIX_INDEX = _build_suffix_index()
+_MAX_SUFFIX = max(len(s) for s in SUFFIX_INDEX)
+
+
+class MorphologicalAnalyzer:
+    """Return candidate (verb, form, person) analyses for Spanish words."""
+
+    def __init__(
+        self,
+        db_path: str = "cards.db",
+        verbs: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.exact: Dict[str, List[Analysis]] = {}
+        # Cells with a stored conjugation; regular analyses of these are
+        # only valid through the exact index.
+        self.stored: Set[Analysis] = set()
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT verb, form, person, conjugation FROM cards"
+            ).fetchall()
+        for verb, form, person, conjugation in rows:
+            if conjugation:
+                self._add(self.exact, conjugation.lower(), (verb, form, person))
+                self.stored.add((verb, form, person))
+
+        if verbs is None:
+            verbs = {row[0] for row in rows}
+        self.verbs: Set[str] = set()
+        for verb in verbs:
+            self.verbs.add(verb)
+            if verb.endswith("se"):
+                self.verbs.add(verb[:-2])
+        self._analyze_plain = lru_cache(maxsize=4096)(self._analyze_plain)
+
+    @staticmethod
+    def _add(index: Dict[str, List[Analysis]], key: str, analysis: Analysis) -> None:
+        bucket = index.setdefault(key, [])
+        if analysis not in bucket:
+            bucket.append(analysis)
+
+    def analyze(self, text: str) -> List[Analysis]:
+        """Return every candidate analysis of ``text``.
+
+        ``text`` is a single verb form, optionally with the pronoun and
+        ``no`` that the deck writes separately (``me levanto``,
+        ``no te levantes``).  Stored conjugations from ``cards.db`` come
+        first, followed by regular and enclitic analyses.
+        """
+        text = " ".join(text.lower().split())
+        results: List[Analysis] = list(self.exact.get(text, ()))
+
+        tokens = text.split(" ")
+        negated = tokens[0] == "no" and len(tokens) > 1
+        if negated:
+            tokens = tokens[1:]
+        pronoun = None
+        if len(tokens) == 2 and tokens[0] in REFLEXIVE_PERSONS:
+            pronoun, tokens = tokens[0], tokens[1:]
+        if len(tokens) != 1 or not tokens[0]:
+            return results
+
+        for verb, form, person in self._analyze_word(tokens[0]):
+            if negated:
+                if form != "subjuntivo_presente" or person == "1st_singular":
+                    continue
+                form = "imperativo_negativo"
+            elif form == "imperativo_negativo":
+                continue
+            if pronoun:
+                if person not in REFLEXIVE_PERSONS[pronoun]:
+                    continue
+                verb = f"{verb}se"
+                if verb not in self.verbs:
+                    continue
+            self._append(results, (verb, form, person))
+        return results
+
+    @staticmethod
+    def _append(results: List[Analysis], analysis: Analysis) -> None:
+        if analysis not in results:
+            results.append(analysis)
+
+    def _analyze_word(self, word: str) -> List[Analysis]:
+        results = list(self._analyze_plain(word))
+        for host, clitics in self._strip_enclitics(word):
+            for verb, form, person in self._analyze_plain(host):
+                if form not in ENCLITIC_FORMS:
+                    continue
+                self._append(results, (verb, form, person))
+                reflexive = f"{verb}se"
+                if (
+                    clitics[0] in REFLEXIVE_PERSONS
+                    and person in REFLEXIVE_PERSONS[clitics[0]]
+                    and reflexive in self.verbs
+                ):
+                    self._append(results, (reflexive, form, person))
+        return results
+
+    def _analyze_plain(self, word: str) -> Tuple[Analysis, ...]:
+        """Return analyses of a pronoun-free ``word``."""
+        results = list(self.exact.get(word, ()))
+        for n in range(1, min(len(word), _MAX_SUFFIX) + 1):
+            head = word[:-n]
+            for ending, form, person, on_infinitive in SUFFIX_INDEX.get(
+                word[-n:], ()
+            ):
+                if on_infinitive:
+                    candidates: Tuple[str, ...] = (head,)
+                else:
+                    candidates = tuple(head + e for e in _INFINITIVE_ENDINGS[ending])
+                for verb in candidates:
+                    analysis = (verb, form, person)
+                    if verb in self.verbs and analysis not in self.stored:
+                        self._append(results, analysis)
+        return tuple(results)
+
+    def _strip_enclitics(self, word: str) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Return ``(host, clitics)`` splits of ``word`` with one or two enclitics.
+
+        The host is de-accented and, for ``-nos``/``-os``, has the final
+        ``s``/``d`` that the pronoun displaced restored.
+        """
+        splits: List[Tuple[str, Tuple[str, ...]]] = []
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(word, ())]
+        while stack:
+            rest, clitics = stack.pop()
+            if len(clitics) == 2:
+                continue
+            for clitic in ENCLITICS:
+                if not rest.endswith(clitic) or len(rest) <= len(clitic) + 1:
+                    continue
+                host = rest[: -len(clitic)]
+                found = (clitic,) + clitics
+                stack.append((host, found))
+                plain = host.translate(ACCENT_REVERSE)
+                hosts = {host, plain}
+                if clitic == "nos" and plain.endswith("mo"):
+                    hosts.add(plain + "s")
+                if clitic == "os":
+                    hosts.add(plain + "d")
+                for candidate in hosts:
+                    splits.append((candidate, found))
+        return splits
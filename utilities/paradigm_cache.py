@@ -0,0 +1,153 @@
+"""Persist compiled regular paradigms for fast warm starts.
+
+The regular grid of every verb in ``verb_data/verbs.csv`` (see
+:meth:`RegularFormGenerator.generate_paradigm_ids`) is compiled together with
+the syllabifications of its forms into one pickled artifact.  The artifact
+records the artifact format, a hash of the generator and phonology sources,
+the syllabification backend and a digest of ``verbs.csv``; :func:`load` only
+reuses it when all of them still match and rebuilds it otherwise.
+
+Example::
+
+    python -m utilities.paradigm_cache
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import phonology
+from .phonology import ACCENT_REVERSE
+from .regular_form_generator import RegularFormGenerator
+
+ROOT = Path(__file__).resolve().parent.parent
+VERBS_PATH = ROOT / "verb_data" / "verbs.csv"
+ARTIFACT_PATH = ROOT / "build" / "paradigms.pickle"
+
+ARTIFACT_FORMAT = 1
+# Modules whose code determines the compiled output.
+SOURCE_FILES = ("regular_form_generator.py", "phonology.py", "syllabifier.py")
+
+Grid = List[List[str]]
+
+
+def generator_version() -> str:
+    """Return a hash identifying the current generator and phonology code."""
+    digest = hashlib.sha256(str(ARTIFACT_FORMAT).encode())
+    here = Path(__file__).resolve().parent
+    for name in SOURCE_FILES:
+        digest.update((here / name).read_bytes())
+    digest.update(phonology.get_backend().encode())
+    return digest.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def load_verbs(path: Path = VERBS_PATH) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [row["verb"] for row in csv.DictReader(f)]
+
+
+def build(
+    verbs_path: Path = VERBS_PATH,
+    artifact_path: Path = ARTIFACT_PATH,
+    generator: Optional[RegularFormGenerator] = None,
+) -> Dict[str, Grid]:
+    """Compile the paradigms of ``verbs_path`` and write the artifact."""
+    generator = generator or RegularFormGenerator()
+    grids = {
+        verb: generator.generate_paradigm_ids(verb) for verb in load_verbs(verbs_path)
+    }
+
+    words = set()
+    for grid in grids.values():
+        for row in grid:
+            for value in row:
+                for word in value.split():
+                    words.add(word)
+                    words.add(word.translate(ACCENT_REVERSE))
+
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "generator_version": generator_version(),
+        "verbs_digest": file_digest(verbs_path),
+        "grids": grids,
+        "syllables": phonology.snapshot(sorted(words)),
+    }
+    artifact_path = Path(artifact_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=artifact_path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, artifact_path)
+    return grids
+
+
+def _read(artifact_path: Path) -> Optional[dict]:
+    try:
+        with open(artifact_path, "rb") as f:
+            artifact = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return artifact if isinstance(artifact, dict) else None
+
+
+def is_current(artifact: Optional[dict], verbs_path: Path = VERBS_PATH) -> bool:
+    """Return whether ``artifact`` matches the current code and verb list."""
+    return (
+        artifact is not None
+        and artifact.get("format") == ARTIFACT_FORMAT
+        and artifact.get("generator_version") == generator_version()
+        and artifact.get("verbs_digest") == file_digest(verbs_path)
+    )
+
+
+def load(
+    verbs_path: Path = VERBS_PATH,
+    artifact_path: Path = ARTIFACT_PATH,
+) -> Dict[str, Grid]:
+    """Return ``{verb: grid}`` from the artifact, rebuilding it when stale.
+
+    The stored syllabifications are preloaded into :mod:`utilities.phonology`.
+    """
+    artifact = _read(artifact_path)
+    if not is_current(artifact, verbs_path):
+        grids = build(verbs_path, artifact_path)
+        artifact = _read(artifact_path)
+        if artifact is None:
+            return grids
+    phonology.preload(artifact["syllables"])
+    return artifact["grids"]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile regular paradigms")
+    parser.add_argument("--verbs", type=Path, default=VERBS_PATH)
+    parser.add_argument("--output", type=Path, default=ARTIFACT_PATH)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    grids = build(args.verbs, args.output)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    load(args.verbs, args.output)
+    loaded = time.perf_counter() - start
+    print(
+        f"Compiled {len(grids)} verbs into {args.output} in {built * 1000:.1f} ms; "
+        f"warm load takes {loaded * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover - simple CLI
+    main()
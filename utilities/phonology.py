@@ -0,0 +1,200 @@
+"""Spanish syllabification and stress helpers.
+
+Shared by :class:`RegularFormGenerator` and
+:class:`RAEConjugationTransformer` to place written accents when enclitic
+pronouns are attached.  Every function is memoised per argument in a bounded
+LRU cache; :func:`cache_info` exposes the hit/miss counters.
+
+:func:`attach_enclitics` syllabifies each host form once; the accent of the
+result then follows from the ``STRESS_SHIFT`` table, so attaching one or two
+pronouns (``levántate``, ``dámelo``) is a lookup.
+
+Syllables come from the rule-based :mod:`utilities.syllabifier` by default;
+``set_backend("pyphen")`` switches to the ``pyphen`` hyphenation patterns.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from .syllabifier import VOWELS, syllabify
+
+ACCENTS = "áéíóú"
+PLAIN = "aeiou"
+ACCENT_MAP = dict(zip(PLAIN, ACCENTS))
+ACCENT_REVERSE = str.maketrans(ACCENTS, PLAIN)
+
+CACHE_SIZE = 4096
+BACKENDS = ("native", "pyphen")
+
+_backend = "native"
+# Syllabifications loaded from a compiled artifact, consulted on cache misses.
+_preloaded: dict[str, tuple[str, ...]] = {}
+
+# Every enclitic pronoun is one syllable ending in a vowel or ``s``; ``os``
+# joins the last syllable of a vowel-final host instead.
+ENCLITICS = ("me", "te", "se", "nos", "os", "lo", "la", "le", "los", "las", "les")
+
+# Whether a host stressed on its ``k``-th syllable from the end needs a
+# written accent once ``n`` more syllables follow it.  The result ends in a
+# vowel or ``s`` and so is stressed on its penultimate syllable by default.
+STRESS_SHIFT = {(k, n): k + n > 2 for k in range(1, 6) for n in range(4)}
+
+# Split a pyphen chunk before a consonant onset that precedes a vowel.
+_ONSET_SPLIT = re.compile(
+    r"(?<=[aeiouáéíóúü])(?=[^aeiouáéíóúü]+[aeiouáéíóúü])", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def hyphenator():
+    """Return the shared Spanish ``pyphen`` dictionary, loading it on first use."""
+    import pyphen
+
+    return pyphen.Pyphen(lang="es")
+
+
+def pyphen_syllables(word: str) -> tuple[str, ...]:
+    """Return the syllables of ``word`` using the ``pyphen`` patterns."""
+    result: list[str] = []
+    for syl in hyphenator().inserted(word).split("-"):
+        result.extend(p for p in _ONSET_SPLIT.split(syl) if p)
+    return tuple(result)
+
+
+def get_backend() -> str:
+    """Return the name of the active syllabification backend."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Select the syllabification backend and drop cached results."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown syllabification backend: {name}")
+    _backend = name
+    _preloaded.clear()
+    cache_clear()
+
+
+def preload(table: dict[str, tuple[str, ...]]) -> None:
+    """Seed syllabifications computed earlier with the active backend."""
+    _preloaded.update(table)
+
+
+def snapshot(words) -> dict[str, tuple[str, ...]]:
+    """Return the syllabification of each of ``words`` for :func:`preload`."""
+    return {word: syllables(word) for word in words}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def syllables(word: str) -> tuple[str, ...]:
+    """Return the syllables of ``word``."""
+    known = _preloaded.get(word)
+    if known is not None:
+        return known
+    if _backend == "pyphen":
+        return pyphen_syllables(word)
+    return syllabify(word)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def stress_index(word: str) -> int:
+    """Return the index of the stressed syllable of ``word``."""
+    syls = syllables(word)
+    for i, s in enumerate(syls):
+        if any(c in ACCENTS for c in s):
+            return i
+    if word[-1].lower() in ("n", "s") or word[-1].lower() in PLAIN:
+        return max(len(syls) - 2, 0)
+    return len(syls) - 1
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def apply_accent(word: str, index: int) -> str:
+    """Return ``word`` with a written accent on syllable ``index``."""
+    syls = list(syllables(word))
+    if index < 0 or index >= len(syls):
+        return word
+    s = syls[index]
+    if not any(c in ACCENTS for c in s):
+        pos = -1
+        for j in range(len(s) - 1, -1, -1):
+            if s[j].lower() in "aeo":
+                pos = j
+                break
+        if pos == -1:
+            for j in range(len(s) - 1, -1, -1):
+                if s[j].lower() in "iu":
+                    pos = j
+                    break
+        if pos != -1:
+            ch = s[pos]
+            accent = ACCENT_MAP.get(ch.lower(), ch)
+            syls[index] = s[:pos] + accent + s[pos + 1 :]
+    return "".join(syls)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def host_profile(word: str) -> tuple[int, str]:
+    """Return ``(k, accented)`` for an enclitic host ``word``.
+
+    ``k`` counts the stressed syllable from the end and ``accented`` is
+    ``word`` with that syllable written with an accent.  Hosts that already
+    carry an accent keep it and report ``k == 0``.
+    """
+    if any(c in ACCENTS for c in word):
+        return 0, word
+    index = stress_index(word)
+    return len(syllables(word)) - index, apply_accent(word, index)
+
+
+def attach_enclitics(form, *clitics, ending="", exceptions=None):
+    """Attach the enclitic pronouns ``clitics`` to ``form``, fixing the accent.
+
+    ``nos`` drops the final ``s`` of ``-mos`` and ``os`` the final ``d`` of
+    the host (``-id`` becoming ``-í`` for ``-ir`` verbs).  ``exceptions``
+    maps ``(form, "".join(clitics))`` to a fixed result such as
+    ``("vayamos", "nos"): "vámonos"``.
+    """
+    suffix = "".join(clitics)
+    if exceptions:
+        fixed = exceptions.get((form, suffix))
+        if fixed is not None:
+            return fixed
+
+    k, accented = host_profile(form)
+    first = clitics[0]
+    if first == "nos" and form.endswith("mos"):
+        form, accented = form[:-1], accented[:-1]
+    elif first == "os" and form.endswith("d"):
+        form, accented = form[:-1], accented[:-1]
+        if ending == "ir" and form.endswith("i"):
+            form = accented = form[:-1] + "í"
+            k = 0
+
+    added = len(clitics)
+    if first == "os" and form[-1:] in VOWELS:
+        added -= 1
+    if k and STRESS_SHIFT[k, added]:
+        return accented + suffix
+    return form + suffix
+
+
+def cache_info() -> dict:
+    """Return the ``functools`` cache statistics of each helper."""
+    return {
+        "syllables": syllables.cache_info(),
+        "stress_index": stress_index.cache_info(),
+        "apply_accent": apply_accent.cache_info(),
+        "host_profile": host_profile.cache_info(),
+    }
+
+
+def cache_clear() -> None:
+    """Empty every cache and reset its counters."""
+    syllables.cache_clear()
+    stress_index.cache_clear()
+    apply_accent.cache_clear()
+    host_profile.cache_clear()
@@ -0,0 +1,68 @@
+"""Thread-safe token-bucket rate limiting per host."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second with bursts of up to ``capacity``.
+
+    A caller that finds the bucket empty reserves the next token and sleeps
+    until it is due, so concurrent callers are spaced ``1 / rate`` apart.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed; return the time slept."""
+        with self._lock:
+            now = self._clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Keep one :class:`TokenBucket` per host."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket(url).acquire()
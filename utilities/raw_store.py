@@ -0,0 +1,173 @@
+"""Raw RAE conjugation tables stored in SQLite for replaying transforms.
+
+:meth:`RAEConjugationFetcher.get_conjugation` returns the tables as parsed
+from the page; :class:`RAEConjugationTransformer` turns them into the deck's
+format.  Keeping the parsed tables in the ``rae_raw`` table of ``cards.db``
+lets a change to the transformer be applied to the whole lexicon without
+fetching or parsing a single page:
+
+* each row holds the base verb, the parsed tables as JSON, when the page was
+  fetched, the page's SHA-256 and the :data:`PARSER_VERSION` it was parsed
+  with; the digest lets a refresh skip parsing pages that did not change;
+* :meth:`RawConjugationStore.load` returns only entries of the current
+  parser version, optionally no older than ``max_age`` seconds.
+
+Running the module re-transforms every stored verb and reports the time::
+
+    python -m utilities.raw_store --db cards.db
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .get_conjugation_rae import (
+    PARSER_VERSION,
+    RAEConjugationTransformer,
+    strip_reflexive,
+)
+
+TABLE = "rae_raw"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class RawConjugationStore:
+    """Parsed RAE tables keyed by base verb, stored in SQLite."""
+
+    def __init__(
+        self, db_path: str = "cards.db", parser_version: int = PARSER_VERSION
+    ) -> None:
+        self.db_path = db_path
+        self.parser_version = parser_version
+        self._pending: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _create(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                verb TEXT PRIMARY KEY,
+                raw TEXT,
+                fetched_at REAL,
+                parser_version INTEGER,
+                page_sha256 TEXT
+            )
+            """
+        )
+        if "page_sha256" not in RawConjugationStore._columns(conn):
+            conn.execute(f"ALTER TABLE {TABLE} ADD COLUMN page_sha256 TEXT")
+
+    @staticmethod
+    def _columns(conn: sqlite3.Connection) -> set:
+        return {row[1] for row in conn.execute(f"PRAGMA table_info({TABLE})")}
+
+    def load_entries(
+        self, max_age: Optional[float] = None
+    ) -> Dict[str, Tuple[Optional[str], dict]]:
+        """Return ``{verb: (page_sha256, raw)}`` for the current parser version.
+
+        With ``max_age`` (seconds) older entries are left out.
+        """
+        oldest = time.time() - max_age if max_age else 0.0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            columns = self._columns(conn)
+            rows = []
+            if columns:  # no table yet; save() creates it
+                # Tables from before page digests were stored lack the column.
+                digest = "page_sha256" if "page_sha256" in columns else "NULL"
+                rows = conn.execute(
+                    f"SELECT verb, {digest}, raw FROM {TABLE} "
+                    "WHERE parser_version=? AND fetched_at>=?",
+                    (self.parser_version, oldest),
+                ).fetchall()
+        finally:
+            conn.close()
+        return {verb: (digest, json.loads(raw)) for verb, digest, raw in rows}
+
+    def load(self, max_age: Optional[float] = None) -> Dict[str, dict]:
+        """Return ``{verb: raw}`` for entries of the current parser version."""
+        return {verb: raw for verb, (_, raw) in self.load_entries(max_age).items()}
+
+    def put(
+        self,
+        verb: str,
+        raw: dict,
+        fetched_at: Optional[float] = None,
+        page_sha256: Optional[str] = None,
+    ) -> None:
+        """Queue ``raw`` for ``verb``; written by :meth:`save`."""
+        self._pending[verb] = (
+            verb,
+            json.dumps(raw, ensure_ascii=False),
+            time.time() if fetched_at is None else fetched_at,
+            self.parser_version,
+            page_sha256,
+        )
+
+    def save(self) -> None:
+        if not self._pending:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            self._create(conn)
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {TABLE} "
+                "(verb, raw, fetched_at, parser_version, page_sha256) "
+                "VALUES (?, ?, ?, ?, ?)",
+                list(self._pending.values()),
+            )
+        self._pending.clear()
+
+
+def transform_all(raws: Dict[str, dict], verbs) -> Dict[str, dict]:
+    """Transform the stored tables of every verb (reflexive or not) in ``verbs``."""
+    out = {}
+    for verb in verbs:
+        base, is_reflexive = strip_reflexive(verb)
+        if base in raws:
+            transformer = RAEConjugationTransformer(verb, is_reflexive=is_reflexive)
+            out[verb] = transformer.transform(raws[base])
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-transform every verb from the stored RAE tables"
+    )
+    parser.add_argument("--db", default="cards.db", help="Path to the cards database")
+    parser.add_argument(
+        "--verbs",
+        default=ROOT / "verb_data" / "verbs.csv",
+        type=Path,
+        help="CSV file listing the verbs",
+    )
+    args = parser.parse_args()
+
+    with open(args.verbs, encoding="utf-8") as f:
+        verbs = [row["verb"] for row in csv.DictReader(f)]
+
+    start = time.perf_counter()
+    raws = RawConjugationStore(args.db).load()
+    loaded = time.perf_counter()
+    out = transform_all(raws, verbs)
+    done = time.perf_counter()
+
+    missing = [verb for verb in verbs if verb not in out]
+    print(
+        f"{len(out)} verbs transformed from {len(raws)} stored tables: "
+        f"load {(loaded - start) * 1000:.1f} ms, "
+        f"transform {(done - loaded) * 1000:.1f} ms"
+    )
+    if missing:
+        print(f"not stored: {', '.join(missing)}")
+
+
+if __name__ == "__main__":  # pragma: no cover - simple CLI
+    main()
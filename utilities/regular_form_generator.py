@@ -1,44 +1,393 @@
-import re
-import pyphen
+import time
+from types import MappingProxyType
 
-ACCENTS = "áéíóú"
-PLAIN = "aeiou"
-ACCENT_MAP = dict(zip(PLAIN, ACCENTS))
-ACCENT_REVERSE = str.maketrans(ACCENTS, PLAIN)
-_dic = pyphen.Pyphen(lang="es")
+from . import phonology
 
 
-class RegularFormGenerator:
-    """Generate hypothetical regular Spanish verb forms."""
+# Suffixes appended to the stem, per form, ending class and person.  The
+# futuro and condicional attach to the whole infinitive instead and live in
+# ``_INFINITIVE_SUFFIXES``.
+_STEM_SUFFIXES = {
+    "indicativo_presente": {
+        "ar": {
+            "1st_singular": "o",
+            "2nd_singular": "as",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "áis",
+            "3rd_plural": "an",
+        },
+        "er": {
+            "1st_singular": "o",
+            "2nd_singular": "es",
+            "3rd_singular": "e",
+            "1st_plural": "emos",
+            "2nd_plural": "éis",
+            "3rd_plural": "en",
+        },
+        "ir": {
+            "1st_singular": "o",
+            "2nd_singular": "es",
+            "3rd_singular": "e",
+            "1st_plural": "imos",
+            "2nd_plural": "ís",
+            "3rd_plural": "en",
+        },
+    },
+    "indicativo_preterito": {
+        "ar": {
+            "1st_singular": "é",
+            "2nd_singular": "aste",
+            "3rd_singular": "ó",
+            "1st_plural": "amos",
+            "2nd_plural": "asteis",
+            "3rd_plural": "aron",
+        },
+        "er": {
+            "1st_singular": "í",
+            "2nd_singular": "iste",
+            "3rd_singular": "ió",
+            "1st_plural": "imos",
+            "2nd_plural": "isteis",
+            "3rd_plural": "ieron",
+        },
+        "ir": {
+            "1st_singular": "í",
+            "2nd_singular": "iste",
+            "3rd_singular": "ió",
+            "1st_plural": "imos",
+            "2nd_plural": "isteis",
+            "3rd_plural": "ieron",
+        },
+    },
+    "indicativo_imperfecto": {
+        "ar": {
+            "1st_singular": "aba",
+            "2nd_singular": "abas",
+            "3rd_singular": "aba",
+            "1st_plural": "ábamos",
+            "2nd_plural": "abais",
+            "3rd_plural": "aban",
+        },
+        "er": {
+            "1st_singular": "ía",
+            "2nd_singular": "ías",
+            "3rd_singular": "ía",
+            "1st_plural": "íamos",
+            "2nd_plural": "íais",
+            "3rd_plural": "ían",
+        },
+        "ir": {
+            "1st_singular": "ía",
+            "2nd_singular": "ías",
+            "3rd_singular": "ía",
+            "1st_plural": "íamos",
+            "2nd_plural": "íais",
+            "3rd_plural": "ían",
+        },
+    },
+    "subjuntivo_presente": {
+        "ar": {
+            "1st_singular": "e",
+            "2nd_singular": "es",
+            "3rd_singular": "e",
+            "1st_plural": "emos",
+            "2nd_plural": "éis",
+            "3rd_plural": "en",
+        },
+        "er": {
+            "1st_singular": "a",
+            "2nd_singular": "as",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "áis",
+            "3rd_plural": "an",
+        },
+        "ir": {
+            "1st_singular": "a",
+            "2nd_singular": "as",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "áis",
+            "3rd_plural": "an",
+        },
+    },
+    "subjuntivo_imperfecto": {
+        "ar": {
+            "1st_singular": "ara",
+            "2nd_singular": "aras",
+            "3rd_singular": "ara",
+            "1st_plural": "áramos",
+            "2nd_plural": "arais",
+            "3rd_plural": "aran",
+        },
+        "er": {
+            "1st_singular": "iera",
+            "2nd_singular": "ieras",
+            "3rd_singular": "iera",
+            "1st_plural": "iéramos",
+            "2nd_plural": "ierais",
+            "3rd_plural": "ieran",
+        },
+        "ir": {
+            "1st_singular": "iera",
+            "2nd_singular": "ieras",
+            "3rd_singular": "iera",
+            "1st_plural": "iéramos",
+            "2nd_plural": "ierais",
+            "3rd_plural": "ieran",
+        },
+    },
+    "subjuntivo_futuro": {
+        "ar": {
+            "1st_singular": "are",
+            "2nd_singular": "ares",
+            "3rd_singular": "are",
+            "1st_plural": "áremos",
+            "2nd_plural": "areis",
+            "3rd_plural": "aren",
+        },
+        "er": {
+            "1st_singular": "iere",
+            "2nd_singular": "ieres",
+            "3rd_singular": "iere",
+            "1st_plural": "iéremos",
+            "2nd_plural": "iereis",
+            "3rd_plural": "ieren",
+        },
+        "ir": {
+            "1st_singular": "iere",
+            "2nd_singular": "ieres",
+            "3rd_singular": "iere",
+            "1st_plural": "iéremos",
+            "2nd_plural": "iereis",
+            "3rd_plural": "ieren",
+        },
+    },
+    "imperativo_afirmativo": {
+        "ar": {
+            "2nd_singular": "a",
+            "3rd_singular": "e",
+            "1st_plural": "emos",
+            "2nd_plural": "ad",
+            "3rd_plural": "en",
+        },
+        "er": {
+            "2nd_singular": "e",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "ed",
+            "3rd_plural": "an",
+        },
+        "ir": {
+            "2nd_singular": "e",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "id",
+            "3rd_plural": "an",
+        },
+    },
+    "imperativo_negativo": {
+        "ar": {
+            "2nd_singular": "es",
+            "3rd_singular": "e",
+            "1st_plural": "emos",
+            "2nd_plural": "éis",
+            "3rd_plural": "en",
+        },
+        "er": {
+            "2nd_singular": "as",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "áis",
+            "3rd_plural": "an",
+        },
+        "ir": {
+            "2nd_singular": "as",
+            "3rd_singular": "a",
+            "1st_plural": "amos",
+            "2nd_plural": "áis",
+            "3rd_plural": "an",
+        },
+    },
+}
+
 
-    FORM_ID_TO_NAME = {
-        0: "infinitivo",
-        1: "gerundio",
-        2: "participio",
-        3: "indicativo_presente",
-        4: "indicativo_preterito",
-        5: "indicativo_imperfecto",
-        6: "indicativo_futuro",
-        7: "condicional",
-        8: "subjuntivo_presente",
-        9: "subjuntivo_imperfecto",
-        10: "subjuntivo_futuro",
-        11: "imperativo_afirmativo",
-        12: "imperativo_negativo",
+_INFINITIVE_SUFFIXES = {
+    "indicativo_futuro": {
+        "1st_singular": "é",
+        "2nd_singular": "ás",
+        "3rd_singular": "á",
+        "1st_plural": "emos",
+        "2nd_plural": "éis",
+        "3rd_plural": "án",
+    },
+    "condicional": {
+        "1st_singular": "ía",
+        "2nd_singular": "ías",
+        "3rd_singular": "ía",
+        "1st_plural": "íamos",
+        "2nd_plural": "íais",
+        "3rd_plural": "ían",
+    },
+}
+
+REFLEXIVE_PRONOUNS = MappingProxyType(
+    {
+        "1st_singular": "me",
+        "2nd_singular": "te",
+        "3rd_singular": "se",
+        "1st_plural": "nos",
+        "2nd_plural": "os",
+        "3rd_plural": "se",
     }
+)
+
+# Imperatives whose enclitic form is not derived by the regular rules.
+ENCLITIC_EXCEPTIONS = MappingProxyType({("amos", "nos"): "ámonos"})
 
-    PERSON_ID_TO_NAME = {
-        0: "not_applicable",
-        11: "1st_singular",
-        21: "2nd_singular",
-        31: "3rd_singular",
-        12: "1st_plural",
-        22: "2nd_plural",
-        32: "3rd_plural",
+# Flat, read-only lookup tables built once at import:
+# ``(form, ending, person) -> suffix`` and ``(form, person) -> suffix``.
+STEM_ENDINGS = MappingProxyType(
+    {
+        (form, ending, person): suffix
+        for form, by_ending in _STEM_SUFFIXES.items()
+        for ending, by_person in by_ending.items()
+        for person, suffix in by_person.items()
     }
+)
+INFINITIVE_ENDINGS = MappingProxyType(
+    {
+        (form, person): suffix
+        for form, by_person in _INFINITIVE_SUFFIXES.items()
+        for person, suffix in by_person.items()
+    }
+)
+
+FORM_ID_TO_NAME = {
+    0: "infinitivo",
+    1: "gerundio",
+    2: "participio",
+    3: "indicativo_presente",
+    4: "indicativo_preterito",
+    5: "indicativo_imperfecto",
+    6: "indicativo_futuro",
+    7: "condicional",
+    8: "subjuntivo_presente",
+    9: "subjuntivo_imperfecto",
+    10: "subjuntivo_futuro",
+    11: "imperativo_afirmativo",
+    12: "imperativo_negativo",
+}
+
+PERSON_ID_TO_NAME = {
+    0: "not_applicable",
+    11: "1st_singular",
+    21: "2nd_singular",
+    31: "3rd_singular",
+    12: "1st_plural",
+    22: "2nd_plural",
+    32: "3rd_plural",
+}
+
+FORM_NAME_TO_ID = {v: k for k, v in FORM_ID_TO_NAME.items()}
+PERSON_NAME_TO_ID = {v: k for k, v in PERSON_ID_TO_NAME.items()}
+
+# Dense id spaces: form ids are 0..12 and person ids are below 33, so a
+# paradigm grid is ``grid[form_id][person_id]``.
+FORM_COUNT = len(FORM_ID_TO_NAME)
+PERSON_ID_LIMIT = max(PERSON_ID_TO_NAME) + 1
+
+INFINITIVO, GERUNDIO, PARTICIPIO = 0, 1, 2
+IMPERATIVO_AFIRMATIVO, IMPERATIVO_NEGATIVO = 11, 12
+
+NON_PERSONAL_FORMS = ("infinitivo", "gerundio", "participio")
+PERSONS = (
+    "1st_singular",
+    "2nd_singular",
+    "3rd_singular",
+    "1st_plural",
+    "2nd_plural",
+    "3rd_plural",
+)
+# Personal forms in deck order with the persons each one is conjugated for.
+PERSONAL_LAYOUT = tuple(
+    (form, PERSONS[1:] if form.startswith("imperativo") else PERSONS)
+    for form in (
+        "indicativo_presente",
+        "indicativo_preterito",
+        "indicativo_imperfecto",
+        "indicativo_futuro",
+        "condicional",
+        "subjuntivo_presente",
+        "subjuntivo_imperfecto",
+        "subjuntivo_futuro",
+        "imperativo_afirmativo",
+        "imperativo_negativo",
+    )
+)
+
+PRONOUNS_BY_PERSON_ID = tuple(
+    REFLEXIVE_PRONOUNS.get(PERSON_ID_TO_NAME.get(i), "")
+    for i in range(PERSON_ID_LIMIT)
+)
+
+
+def _template_cell(form, ending, person):
+    """Return ``(base, suffix)`` for one cell.
+
+    ``base`` selects the stem (0), the bare infinitive (1) or nothing (2) to
+    prepend to ``suffix``.
+    """
+    if (form, person) in INFINITIVE_ENDINGS:
+        return 1, INFINITIVE_ENDINGS[form, person]
+    if (form, ending, person) in STEM_ENDINGS:
+        return 0, STEM_ENDINGS[form, ending, person]
+    return 2, ""
+
 
-    FORM_NAME_TO_ID = {v: k for k, v in FORM_ID_TO_NAME.items()}
-    PERSON_NAME_TO_ID = {v: k for k, v in PERSON_ID_TO_NAME.items()}
+# Per ending class, the personal part of a paradigm as
+# ``(form_id, ((person_id, base, suffix), ...))`` in deck order.
+_PARADIGM_TEMPLATES = {
+    ending: tuple(
+        (
+            FORM_NAME_TO_ID[form],
+            tuple(
+                (PERSON_NAME_TO_ID[person],) + _template_cell(form, ending, person)
+                for person in persons
+            ),
+        )
+        for form, persons in PERSONAL_LAYOUT
+    )
+    for ending in ("ar", "er", "ir", "")
+}
+
+
+def _id_cells(templates):
+    """Return ``cells[form_id][person_id] -> (base, suffix)`` or None."""
+    grid = [[None] * PERSON_ID_LIMIT for _ in range(FORM_COUNT)]
+    for form_id, cells in templates:
+        for person_id, base, suffix in cells:
+            if base != 2:
+                grid[form_id][person_id] = (base, suffix)
+    return tuple(tuple(row) for row in grid)
+
+
+_ID_CELLS = {
+    ending: _id_cells(templates) for ending, templates in _PARADIGM_TEMPLATES.items()
+}
+
+
+class RegularFormGenerator:
+    """Generate hypothetical regular Spanish verb forms."""
+
+    FORM_ID_TO_NAME = FORM_ID_TO_NAME
+    PERSON_ID_TO_NAME = PERSON_ID_TO_NAME
+    FORM_NAME_TO_ID = FORM_NAME_TO_ID
+    PERSON_NAME_TO_ID = PERSON_NAME_TO_ID
+
+    # Size, duration and forms/sec of the most recent generate_many() call.
+    last_batch_stats = None
 
     def get_verb_stem_and_ending(self, verb):
         """Extract stem and ending from a verb.
@@ -66,75 +415,193 @@ class RegularFormGenerator:
             return verb, "", False
 
     def get_reflexive_pronoun(self, person):
-        pronouns = {
-            "1st_singular": "me",
-            "2nd_singular": "te",
-            "3rd_singular": "se",
-            "1st_plural": "nos",
-            "2nd_plural": "os",
-            "3rd_plural": "se",
-        }
-        return pronouns.get(person, "")
-
-    def _syllables(self, word: str) -> list[str]:
-        syls = _dic.inserted(word).split("-")
-        result: list[str] = []
-        for syl in syls:
-            parts = re.split(
-                r"(?<=[aeiouáéíóúü])(?=[^aeiouáéíóúü]+[aeiouáéíóúü])",
-                syl,
-                flags=re.IGNORECASE,
-            )
-            result.extend([p for p in parts if p])
-        return result
-
-    def _stress_index(self, word: str) -> int:
-        syls = self._syllables(word)
-        for i, s in enumerate(syls):
-            if any(c in ACCENTS for c in s):
-                return i
-        if word[-1].lower() in ("n", "s") or word[-1].lower() in PLAIN:
-            return max(len(syls) - 2, 0)
-        return len(syls) - 1
-
-    def _apply_accent(self, word: str, index: int) -> str:
-        syls = self._syllables(word)
-        if index < 0 or index >= len(syls):
-            return word
-        s = syls[index]
-        if any(c in ACCENTS for c in s):
-            syls[index] = s
-        else:
-            pos = -1
-            for j in range(len(s) - 1, -1, -1):
-                ch = s[j].lower()
-                if ch in "aeo":
-                    pos = j
-                    break
-            if pos == -1:
-                for j in range(len(s) - 1, -1, -1):
-                    if s[j].lower() in "iu":
-                        pos = j
-                        break
-            if pos != -1:
-                ch = s[pos]
-                accent = ACCENT_MAP.get(ch.lower(), ch)
-                s = s[:pos] + accent + s[pos + 1 :]
-            syls[index] = s
-        return "".join(syls)
+        return REFLEXIVE_PRONOUNS.get(person, "")
 
     def generate(self, verb, form, person):
-        """Generate the regular conjugation for the given verb, form and person."""
+        """Generate the regular conjugation for the given verb, form and person.
+
+        ``form`` and ``person`` may be names or ids; names are mapped to ids
+        and passed on to :meth:`generate_id`.
+        """
+        if not isinstance(form, int):
+            form = FORM_NAME_TO_ID.get(form, -1)
+        if not isinstance(person, int):
+            person = PERSON_NAME_TO_ID.get(person, -1)
+        return self.generate_id(verb, form, person)
+
+    def generate_id(self, verb, form_id, person_id):
+        """Generate the regular conjugation for integer form and person ids."""
+        stem, ending, is_reflexive = self.get_verb_stem_and_ending(verb)
+        if 0 <= form_id <= PARTICIPIO:
+            return self._non_personal(verb, stem, ending, is_reflexive, form_id)
+        if not (0 <= form_id < FORM_COUNT and 0 <= person_id < PERSON_ID_LIMIT):
+            return ""
+        cell = _ID_CELLS[ending][form_id][person_id]
+        if cell is None:
+            return ""
+
+        base, suffix = cell
+        if base == 0:
+            conjugated = stem + suffix
+        else:
+            conjugated = (verb[:-2] if is_reflexive else verb) + suffix
+        if is_reflexive:
+            pronoun = PRONOUNS_BY_PERSON_ID[person_id]
+            if form_id == IMPERATIVO_AFIRMATIVO:
+                return self._attach_enclitic(conjugated, pronoun, ending)
+            conjugated = f"{pronoun} {conjugated}"
+        if form_id == IMPERATIVO_NEGATIVO:
+            return f"no {conjugated}"
+        return conjugated
+
+    def generate_paradigm(self, verb):
+        """Generate every regular form of ``verb`` in one pass.
+
+        Returns ``{form: {person: conjugation}}`` covering all 13 forms, with
+        non-personal forms keyed by ``"not_applicable"`` and imperatives
+        without ``"1st_singular"``.  The stem analysis runs once per verb
+        instead of once per cell as with :meth:`generate`.
+        """
+        grid = self.generate_paradigm_ids(verb)
+        paradigm = {
+            form: {"not_applicable": grid[form_id][0]}
+            for form_id, form in enumerate(NON_PERSONAL_FORMS)
+        }
+        for form_id, cells in _PARADIGM_TEMPLATES[""]:
+            row = grid[form_id]
+            paradigm[FORM_ID_TO_NAME[form_id]] = {
+                PERSON_ID_TO_NAME[person_id]: row[person_id]
+                for person_id, _, _ in cells
+            }
+        return paradigm
+
+    def generate_paradigm_ids(self, verb):
+        """Generate every regular form of ``verb`` as a dense id grid.
+
+        Returns a list indexed by ``form_id`` of lists indexed by
+        ``person_id``; cells without a form hold ``""``.
+        """
         stem, ending, is_reflexive = self.get_verb_stem_and_ending(verb)
+        grid = [[""] * PERSON_ID_LIMIT for _ in range(FORM_COUNT)]
+        for form_id in (INFINITIVO, GERUNDIO, PARTICIPIO):
+            grid[form_id][0] = self._non_personal(
+                verb, stem, ending, is_reflexive, form_id
+            )
+
+        bases = (stem, verb[:-2] if is_reflexive else verb, "")
+        for form_id, cells in _PARADIGM_TEMPLATES[ending]:
+            row = grid[form_id]
+            for person_id, base, suffix in cells:
+                row[person_id] = bases[base] + suffix
+
+        if is_reflexive:
+            for form_id, cells in _PARADIGM_TEMPLATES[ending]:
+                row = grid[form_id]
+                for person_id, _, _ in cells:
+                    value = row[person_id]
+                    if not value:
+                        continue
+                    pronoun = PRONOUNS_BY_PERSON_ID[person_id]
+                    if form_id == IMPERATIVO_AFIRMATIVO:
+                        row[person_id] = self._attach_enclitic(value, pronoun, ending)
+                    else:
+                        row[person_id] = f"{pronoun} {value}"
+
+        row = grid[IMPERATIVO_NEGATIVO]
+        for person_id, value in enumerate(row):
+            if value:
+                row[person_id] = f"no {value}"
+        return grid
+
+    def generate_many(self, verbs, forms=None, persons=None):
+        """Generate regular forms for many verbs as aligned columns.
+
+        ``forms`` and ``persons`` optionally restrict the output to the given
+        ids (or names).  Verbs are grouped by ending class and reflexivity so
+        each suffix is concatenated onto a whole group of stems at once.
 
-        if isinstance(form, int):
-            form = self.FORM_ID_TO_NAME.get(form, form)
-        if isinstance(person, int):
-            person = self.PERSON_ID_TO_NAME.get(person, person)
+        Returns ``{"verb": [...], "form_id": [...], "person_id": [...],
+        "conjugation": [...]}`` ordered by group; cells without a form (such
+        as the participio of a reflexive verb) are omitted.  The size and
+        throughput of the run are stored in ``last_batch_stats``.
+        """
+        start = time.perf_counter()
+        form_ids = self._id_filter(forms, FORM_NAME_TO_ID)
+        person_ids = self._id_filter(persons, PERSON_NAME_TO_ID)
+
+        groups = {}
+        for verb in verbs:
+            stem, ending, is_reflexive = self.get_verb_stem_and_ending(verb)
+            groups.setdefault((ending, is_reflexive), []).append((verb, stem))
+
+        columns = {"verb": [], "form_id": [], "person_id": [], "conjugation": []}
+        for (ending, is_reflexive), members in groups.items():
+            names = [verb for verb, _ in members]
+            stems = [stem for _, stem in members]
+            infinitives = [verb[:-2] for verb in names] if is_reflexive else names
+
+            for form_id in (INFINITIVO, GERUNDIO, PARTICIPIO):
+                if form_ids is not None and form_id not in form_ids:
+                    continue
+                if person_ids is not None and 0 not in person_ids:
+                    continue
+                values = [
+                    self._non_personal(verb, stem, ending, is_reflexive, form_id)
+                    for verb, stem in members
+                ]
+                self._extend_columns(columns, names, form_id, 0, values)
+
+            for form_id, cells in _PARADIGM_TEMPLATES[ending]:
+                if form_ids is not None and form_id not in form_ids:
+                    continue
+                for person_id, base, suffix in cells:
+                    if base == 2 or (
+                        person_ids is not None and person_id not in person_ids
+                    ):
+                        continue
+                    bases = stems if base == 0 else infinitives
+                    values = [b + suffix for b in bases]
+                    if is_reflexive:
+                        pronoun = PRONOUNS_BY_PERSON_ID[person_id]
+                        if form_id == IMPERATIVO_AFIRMATIVO:
+                            values = [
+                                self._attach_enclitic(v, pronoun, ending)
+                                for v in values
+                            ]
+                        else:
+                            values = [f"{pronoun} {v}" for v in values]
+                    if form_id == IMPERATIVO_NEGATIVO:
+                        values = [f"no {v}" for v in values]
+                    self._extend_columns(columns, names, form_id, person_id, values)
+
+        elapsed = time.perf_counter() - start
+        count = len(columns["conjugation"])
+        self.last_batch_stats = {
+            "forms": count,
+            "seconds": elapsed,
+            "forms_per_sec": count / elapsed if elapsed > 0 else float("inf"),
+        }
+        return columns
+
+    @staticmethod
+    def _id_filter(values, name_to_id):
+        if values is None:
+            return None
+        return {name_to_id.get(v, v) for v in values}
 
-        if form == "infinitivo":
+    @staticmethod
+    def _extend_columns(columns, verbs, form_id, person_id, values):
+        for verb, value in zip(verbs, values):
+            if value:
+                columns["verb"].append(verb)
+                columns["form_id"].append(form_id)
+                columns["person_id"].append(person_id)
+                columns["conjugation"].append(value)
+
+    def _non_personal(self, verb, stem, ending, is_reflexive, form_id):
+        if form_id == INFINITIVO:
             return verb
-        elif form == "gerundio":
+        elif form_id == GERUNDIO:
             base_form = stem + ("ando" if ending == "ar" else "iendo")
             if is_reflexive:
                 if base_form.endswith("ando"):
@@ -145,312 +612,15 @@ class RegularFormGenerator:
                     return base_form.replace("yendo", "yéndose")
                 return base_form + "se"
             return base_form
-        elif form == "participio":
-            if is_reflexive:
-                return ""
-            if ending == "ar":
-                return stem + "ado"
-            else:
-                return stem + "ido"
-
-        if person == "not_applicable":
+        if is_reflexive:
             return ""
+        if ending == "ar":
+            return stem + "ado"
+        return stem + "ido"
 
-        conjugations = {
-            "indicativo_presente": {
-                "ar": {
-                    "1st_singular": "o",
-                    "2nd_singular": "as",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "áis",
-                    "3rd_plural": "an",
-                },
-                "er": {
-                    "1st_singular": "o",
-                    "2nd_singular": "es",
-                    "3rd_singular": "e",
-                    "1st_plural": "emos",
-                    "2nd_plural": "éis",
-                    "3rd_plural": "en",
-                },
-                "ir": {
-                    "1st_singular": "o",
-                    "2nd_singular": "es",
-                    "3rd_singular": "e",
-                    "1st_plural": "imos",
-                    "2nd_plural": "ís",
-                    "3rd_plural": "en",
-                },
-            },
-            "indicativo_preterito": {
-                "ar": {
-                    "1st_singular": "é",
-                    "2nd_singular": "aste",
-                    "3rd_singular": "ó",
-                    "1st_plural": "amos",
-                    "2nd_plural": "asteis",
-                    "3rd_plural": "aron",
-                },
-                "er": {
-                    "1st_singular": "í",
-                    "2nd_singular": "iste",
-                    "3rd_singular": "ió",
-                    "1st_plural": "imos",
-                    "2nd_plural": "isteis",
-                    "3rd_plural": "ieron",
-                },
-                "ir": {
-                    "1st_singular": "í",
-                    "2nd_singular": "iste",
-                    "3rd_singular": "ió",
-                    "1st_plural": "imos",
-                    "2nd_plural": "isteis",
-                    "3rd_plural": "ieron",
-                },
-            },
-            "indicativo_imperfecto": {
-                "ar": {
-                    "1st_singular": "aba",
-                    "2nd_singular": "abas",
-                    "3rd_singular": "aba",
-                    "1st_plural": "ábamos",
-                    "2nd_plural": "abais",
-                    "3rd_plural": "aban",
-                },
-                "er": {
-                    "1st_singular": "ía",
-                    "2nd_singular": "ías",
-                    "3rd_singular": "ía",
-                    "1st_plural": "íamos",
-                    "2nd_plural": "íais",
-                    "3rd_plural": "ían",
-                },
-                "ir": {
-                    "1st_singular": "ía",
-                    "2nd_singular": "ías",
-                    "3rd_singular": "ía",
-                    "1st_plural": "íamos",
-                    "2nd_plural": "íais",
-                    "3rd_plural": "ían",
-                },
-            },
-            "condicional": {
-                "ar": {
-                    "1st_singular": "aría",
-                    "2nd_singular": "arías",
-                    "3rd_singular": "aría",
-                    "1st_plural": "aríamos",
-                    "2nd_plural": "aríais",
-                    "3rd_plural": "arían",
-                },
-                "er": {
-                    "1st_singular": "ería",
-                    "2nd_singular": "erías",
-                    "3rd_singular": "ería",
-                    "1st_plural": "eríamos",
-                    "2nd_plural": "eríais",
-                    "3rd_plural": "erían",
-                },
-                "ir": {
-                    "1st_singular": "iría",
-                    "2nd_singular": "irías",
-                    "3rd_singular": "iría",
-                    "1st_plural": "iríamos",
-                    "2nd_plural": "iríais",
-                    "3rd_plural": "irían",
-                },
-            },
-            "subjuntivo_presente": {
-                "ar": {
-                    "1st_singular": "e",
-                    "2nd_singular": "es",
-                    "3rd_singular": "e",
-                    "1st_plural": "emos",
-                    "2nd_plural": "éis",
-                    "3rd_plural": "en",
-                },
-                "er": {
-                    "1st_singular": "a",
-                    "2nd_singular": "as",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "áis",
-                    "3rd_plural": "an",
-                },
-                "ir": {
-                    "1st_singular": "a",
-                    "2nd_singular": "as",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "áis",
-                    "3rd_plural": "an",
-                },
-            },
-            "subjuntivo_imperfecto": {
-                "ar": {
-                    "1st_singular": "ara",
-                    "2nd_singular": "aras",
-                    "3rd_singular": "ara",
-                    "1st_plural": "áramos",
-                    "2nd_plural": "arais",
-                    "3rd_plural": "aran",
-                },
-                "er": {
-                    "1st_singular": "iera",
-                    "2nd_singular": "ieras",
-                    "3rd_singular": "iera",
-                    "1st_plural": "iéramos",
-                    "2nd_plural": "ierais",
-                    "3rd_plural": "ieran",
-                },
-                "ir": {
-                    "1st_singular": "iera",
-                    "2nd_singular": "ieras",
-                    "3rd_singular": "iera",
-                    "1st_plural": "iéramos",
-                    "2nd_plural": "ierais",
-                    "3rd_plural": "ieran",
-                },
-            },
-            "subjuntivo_futuro": {
-                "ar": {
-                    "1st_singular": "are",
-                    "2nd_singular": "ares",
-                    "3rd_singular": "are",
-                    "1st_plural": "áremos",
-                    "2nd_plural": "areis",
-                    "3rd_plural": "aren",
-                },
-                "er": {
-                    "1st_singular": "iere",
-                    "2nd_singular": "ieres",
-                    "3rd_singular": "iere",
-                    "1st_plural": "iéremos",
-                    "2nd_plural": "iereis",
-                    "3rd_plural": "ieren",
-                },
-                "ir": {
-                    "1st_singular": "iere",
-                    "2nd_singular": "ieres",
-                    "3rd_singular": "iere",
-                    "1st_plural": "iéremos",
-                    "2nd_plural": "iereis",
-                    "3rd_plural": "ieren",
-                },
-            },
-            "imperativo_afirmativo": {
-                "ar": {
-                    "2nd_singular": "a",
-                    "3rd_singular": "e",
-                    "1st_plural": "emos",
-                    "2nd_plural": "ad",
-                    "3rd_plural": "en",
-                },
-                "er": {
-                    "2nd_singular": "e",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "ed",
-                    "3rd_plural": "an",
-                },
-                "ir": {
-                    "2nd_singular": "e",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "id",
-                    "3rd_plural": "an",
-                },
-            },
-            "imperativo_negativo": {
-                "ar": {
-                    "2nd_singular": "es",
-                    "3rd_singular": "e",
-                    "1st_plural": "emos",
-                    "2nd_plural": "éis",
-                    "3rd_plural": "en",
-                },
-                "er": {
-                    "2nd_singular": "as",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "áis",
-                    "3rd_plural": "an",
-                },
-                "ir": {
-                    "2nd_singular": "as",
-                    "3rd_singular": "a",
-                    "1st_plural": "amos",
-                    "2nd_plural": "áis",
-                    "3rd_plural": "an",
-                },
-            },
-        }
-
-        if form in ["indicativo_futuro", "condicional"]:
-            base_verb = verb[:-2] if is_reflexive else verb
-            if form == "indicativo_futuro":
-                endings = {
-                    "1st_singular": "é",
-                    "2nd_singular": "ás",
-                    "3rd_singular": "á",
-                    "1st_plural": "emos",
-                    "2nd_plural": "éis",
-                    "3rd_plural": "án",
-                }
-            else:
-                endings = {
-                    "1st_singular": "ía",
-                    "2nd_singular": "ías",
-                    "3rd_singular": "ía",
-                    "1st_plural": "íamos",
-                    "2nd_plural": "íais",
-                    "3rd_plural": "ían",
-                }
-            if person in endings:
-                conjugated = base_verb + endings[person]
-                if is_reflexive:
-                    pronoun = self.get_reflexive_pronoun(person)
-                    return f"{pronoun} {conjugated}"
-                return conjugated
-
-        if form in conjugations and ending in conjugations[form]:
-            if person in conjugations[form][ending]:
-                base_conjugation = stem + conjugations[form][ending][person]
-                if is_reflexive:
-                    pronoun = self.get_reflexive_pronoun(person)
-                    if form == "imperativo_afirmativo":
-                        original = base_conjugation
-                        if person == "1st_plural" and base_conjugation.endswith("mos"):
-                            base_conjugation = base_conjugation[:-1]
-                            result = base_conjugation + pronoun
-                            if original == "amos":
-                                return "ámonos"
-                        elif person == "2nd_plural" and base_conjugation.endswith("d"):
-                            trimmed = base_conjugation[:-1]
-                            if ending == "ir" and trimmed.endswith("i"):
-                                trimmed = trimmed[:-1] + "í"
-                            result = trimmed + pronoun
-                            return result
-                        else:
-                            result = base_conjugation + pronoun
-
-                        if any(c in ACCENTS for c in original):
-                            return result
-
-                        orig_idx = self._stress_index(original)
-                        new_default = self._stress_index(
-                            result.translate(ACCENT_REVERSE)
-                        )
-                        if orig_idx != new_default:
-                            result = self._apply_accent(result, orig_idx)
-                        return result
-                    result = f"{pronoun} {base_conjugation}"
-                    if form == "imperativo_negativo":
-                        return f"no {result}"
-                    return result
-                else:
-                    if form == "imperativo_negativo":
-                        return f"no {base_conjugation}"
-                    return base_conjugation
-        return ""
+    @staticmethod
+    def _attach_enclitic(base_conjugation, pronoun, ending):
+        """Attach ``pronoun`` to an affirmative imperative, fixing the accent."""
+        return phonology.attach_enclitics(
+            base_conjugation, pronoun, ending=ending, exceptions=ENCLITIC_EXCEPTIONS
+        )
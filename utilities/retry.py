@@ -0,0 +1,190 @@
+"""Retries with jittered backoff, a circuit breaker and fetch counters.
+
+:class:`RAEConjugationFetcher` retries transient failures (connection
+errors, timeouts, 429 and 5xx responses, Cloudflare challenges) following
+a :class:`RetryPolicy`.  Consecutive transient failures open a
+:class:`CircuitBreaker`, which pauses every worker for a cooldown and then
+lets one probe request through; if it trips again before a single fetch
+has succeeded it stays open, and every fetch fails at once with
+:class:`CircuitOpen`.  :class:`FetchStats` counts requests, retries,
+failures, ``304 Not Modified`` answers, pages whose content had not
+changed, and latency.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable
+
+# HTTP statuses worth retrying; Cloudflare answers challenges with 403/503.
+TRANSIENT_STATUSES = frozenset(
+    {403, 408, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524}
+)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return whether ``exc`` is worth retrying."""
+    import requests
+    from cloudscraper.exceptions import CloudflareCode1020, CloudflareException
+
+    if isinstance(exc, CloudflareException):
+        return not isinstance(exc, CloudflareCode1020)  # 1020: access denied
+    if isinstance(exc, requests.HTTPError):
+        response = exc.response
+        return response is not None and response.status_code in TRANSIENT_STATUSES
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+class CircuitOpen(RuntimeError):
+    """Raised instead of fetching while the circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Make up to ``attempts`` attempts with full-jitter exponential backoff."""
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+
+    def delay(self, retry: int, rng: Callable[[], float] = random.random) -> float:
+        """Return the pause before retry number ``retry`` (starting at 1)."""
+        return rng() * min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+
+
+class CircuitBreaker:
+    """Pause fetches for ``cooldown`` seconds after ``threshold`` failures in a row.
+
+    Once the cooldown is over one request goes through as a probe while the
+    other callers keep waiting: a success closes the breaker, a failure
+    trips it again.  A breaker that trips again with no success since its
+    previous trip stays open and :meth:`wait` raises :class:`CircuitOpen`:
+    the host is down, and waiting for it would stall the run.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.trips = 0
+        self._failures = 0
+        self._succeeded = False  # since the last trip
+        self._open_until = 0.0
+        self._half_open = False  # tripped; the next request is a probe
+        self._prober: int | None = None  # thread making the probe
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+
+    @property
+    def is_open(self) -> bool:
+        return self._clock() < self._open_until
+
+    def wait(self) -> float:
+        """Block while the breaker is open; return the time slept.
+
+        Raises :class:`CircuitOpen` once the breaker has given up.
+        """
+        slept = 0.0
+        while True:
+            with self._cond:
+                while self._prober is not None:
+                    self._cond.wait()
+                if self._open_until == float("inf"):
+                    raise CircuitOpen(f"circuit open after {self.trips} trip(s)")
+                remaining = self._open_until - self._clock()
+                if remaining <= 0:
+                    if self._half_open:
+                        self._prober = threading.get_ident()
+                    return slept
+            self._sleep(remaining)
+            slept += remaining
+
+    def record_success(self) -> None:
+        with self._cond:
+            self._failures = 0
+            self._succeeded = True
+            self._half_open = False
+            self._prober = None
+            self._cond.notify_all()
+
+    def record_failure(self) -> None:
+        with self._cond:
+            self._failures += 1
+            # Requests sent before a trip may fail during the probe; only the
+            # probe's own failure trips the breaker again.
+            probe = self._prober == threading.get_ident()
+            if probe or self._failures >= self.threshold:
+                if self.trips and not self._succeeded:
+                    self._open_until = float("inf")
+                else:
+                    self._open_until = self._clock() + self.cooldown
+                self._failures = 0
+                self._succeeded = False
+                self._half_open = True
+                self._prober = None
+                self.trips += 1
+                self._cond.notify_all()
+
+
+class FetchStats:
+    """Thread-safe counters for network fetches."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_request(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def record_unchanged(self) -> None:
+        with self._lock:
+            self.unchanged += 1
+
+    def summary(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "latency_mean": (
+                self.latency_total / self.requests if self.requests else 0.0
+            ),
+            "latency_max": self.latency_max,
+        }
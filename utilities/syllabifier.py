@@ -0,0 +1,46 @@
+"""Rule-based Spanish syllabification.
+
+Spanish syllable boundaries follow a small set of regular rules, so they are
+expressed directly as one compiled regular expression instead of running the
+generic TeX hyphenation patterns of ``pyphen``:
+
+* ``ch``, ``ll`` and ``rr`` are single consonants.
+* A consonant followed by a vowel starts a new syllable, together with a
+  preceding consonant when both form an inseparable onset (``pr``, ``bl``,
+  ``tr``, ...).  Remaining consonants close the previous syllable.
+* Adjacent vowels stay in one syllable (diphthongs and triphthongs) unless
+  one of them is an accented ``í`` or ``ú``, which forces a hiatus.
+* ``y`` counts as a consonant; word-final ``y`` therefore stays with the
+  preceding vowel as in ``estoy``.
+"""
+
+from __future__ import annotations
+
+import re
+
+VOWELS = "aeiouáéíóúü"
+CONSONANTS = "bcdfghjklmnñpqrstvwxyz"
+
+_ONSET = rf"(?:ch|ll|rr|[pbfgck][lr]|[td]r|[{CONSONANTS}])"
+_BOUNDARY = re.compile(
+    rf"""
+    # vowel | onset vowel
+    (?<=[{VOWELS}])(?={_ONSET}[{VOWELS}])
+    # consonant | onset vowel, unless that splits a digraph or cluster or
+    # leaves a word-initial consonant on its own
+  | (?<=[{CONSONANTS}])(?<!^[{CONSONANTS}])
+    (?!(?<=c)h|(?<=l)l|(?<=r)r|(?<=[pbfgck])[lr]|(?<=[td])r)
+    (?={_ONSET}[{VOWELS}])
+    # hiatus around an accented weak vowel
+  | (?<=[{VOWELS}])(?=[íú])
+  | (?<=[íú])(?=[{VOWELS}])
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+def syllabify(word: str) -> tuple[str, ...]:
+    """Return the syllables of ``word``."""
+    if not word:
+        return ()
+    return tuple(_BOUNDARY.split(word))